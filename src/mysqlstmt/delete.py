@@ -108,6 +108,18 @@ class Delete(Stmt, WhereMixin, JoinMixin):
         ('DELETE LOW_PRIORITY FROM t1 WHERE `t1c1` = 1', None)
     """
 
+    __slots__ = (
+        "_active_cond",
+        "_cached_sql",
+        "_join_refs",
+        "_limit",
+        "_orderby_conds",
+        "_table_names",
+        "_where_cond_root",
+        "allow_unqualified_delete",
+        "ignore_error",
+    )
+
     def __init__(
         self,
         table_name: str | Collection[str] | None = None,
@@ -134,6 +146,7 @@ class Delete(Stmt, WhereMixin, JoinMixin):
         self._table_names = []
         self._orderby_conds = []
         self._limit = None
+        self._cached_sql: tuple[int, SQLReturnT] | None = None
 
         if table_name:
             self.from_table(table_name)
@@ -155,6 +168,7 @@ class Delete(Stmt, WhereMixin, JoinMixin):
         else:
             self._table_names.append(list_or_name)
 
+        self._invalidate_sql_cache()
         return self
 
     def order_by(self, list_or_name: str | Collection[str]) -> Delete:
@@ -171,6 +185,7 @@ class Delete(Stmt, WhereMixin, JoinMixin):
                 self.order_by(c)
         else:
             self._orderby_conds.append(list_or_name)
+            self._invalidate_sql_cache()
 
         return self
 
@@ -184,9 +199,10 @@ class Delete(Stmt, WhereMixin, JoinMixin):
             object: self
         """
         self._limit = row_count
+        self._invalidate_sql_cache()
         return self
 
-    def sql(self) -> SQLReturnT:  # noqa: C901, PLR0912
+    def sql(self) -> SQLReturnT:  # noqa: C901, PLR0912, PLR0915
         """Build DELETE SQL statement.
 
         Returns:
@@ -196,6 +212,9 @@ class Delete(Stmt, WhereMixin, JoinMixin):
         Raises:
             ValueError: The statement cannot be created with the given attributes.
         """
+        if self._cached_sql is not None and self._cached_sql[0] == self._sql_version:
+            return self._fresh_sql_result(self._cached_sql[1])
+
         if not self._table_names:
             msg = "DELETE requires at least one table"
             raise ValueError(msg)
@@ -272,6 +291,10 @@ class Delete(Stmt, WhereMixin, JoinMixin):
                 raise ValueError(msg)
 
         if self.placeholder:
-            return " ".join(sql), param_values if param_values else None
-        assert not param_values
-        return " ".join(sql)
+            result: SQLReturnT = (" ".join(sql), param_values if param_values else None)
+        else:
+            assert not param_values
+            result = " ".join(sql)
+
+        self._cached_sql = (self._sql_version, result)
+        return self._fresh_sql_result(result)
@@ -9,12 +9,15 @@ from __future__ import annotations
 from collections.abc import Collection
 from typing import TYPE_CHECKING
 
+from .config import Config
 from .select import Select
 from .set_values_mixin import SetValuesMixin
-from .stmt import Stmt, StmtPickleT
+from .stmt import Stmt, StmtPickleT, _quote_col_ref
 
 if TYPE_CHECKING:
-    from .stmt import SQLReturnT
+    from collections.abc import Callable
+
+    from .stmt import SQLReturnT, StmtParamValuesT
 
 
 SetBatchValueT = Collection[StmtPickleT]
@@ -44,6 +47,18 @@ class Insert(Stmt, SetValuesMixin):
         :py:class:`mysqlstmt.replace.Replace`
     """
 
+    __slots__ = (
+        "_batch_values",
+        "_cached_sql",
+        "_columns",
+        "_replace",
+        "_select",
+        "_table_name",
+        "_values",
+        "_values_raw",
+        "ignore_error",
+    )
+
     def __init__(self, table_name: str | None = None, ignore_error: bool = False, **kwargs) -> None:
         """Constructor.
 
@@ -63,6 +78,7 @@ class Insert(Stmt, SetValuesMixin):
         self._select: str | Select | None = None
         self._batch_values: list[SetBatchValueT] = []
         self._replace = False
+        self._cached_sql: tuple[tuple[int, int | None], SQLReturnT] | None = None
 
         if table_name:
             self.into_table(table_name)
@@ -84,6 +100,7 @@ class Insert(Stmt, SetValuesMixin):
             raise ValueError(msg)  # noqa: TRY004
 
         self._table_name = table_name
+        self._invalidate_sql_cache()
         return self
 
     def column(self, list_or_name: str | Collection[str]) -> Insert:
@@ -100,6 +117,7 @@ class Insert(Stmt, SetValuesMixin):
                 self.column(c)
         else:
             self._columns.append(list_or_name)
+            self._invalidate_sql_cache()
         return self
 
     columns = column
@@ -128,8 +146,19 @@ class Insert(Stmt, SetValuesMixin):
             >>> qselect = Select('t2').columns(['t2c1', 't2c2'])
             >>> q.into_table('t1').columns(['t1c1','t1c2']).select(qselect).sql()
             ('INSERT INTO t1 (`t1c1`, `t1c2`) SELECT `t2c1`, `t2c2` FROM t2', None)
+
+        Raises:
+            ValueError: The statement is incompatible with INSERT...SELECT.
         """
+        if self._values or self._values_raw:
+            msg = "set_value and set_raw_value are incompatible with INSERT...SELECT"
+            raise ValueError(msg)
+        if self._batch_values:
+            msg = "set_batch_value is incompatible with INSERT...SELECT"
+            raise ValueError(msg)
+
         self._select = stmt
+        self._invalidate_sql_cache()
         return self
 
     def set_batch_value(self, values: Collection[SetBatchValueT]) -> Insert:
@@ -174,13 +203,73 @@ class Insert(Stmt, SetValuesMixin):
             >>> data = [["'r1v1'","'r1v2'", 'NOW()'], ["'r2v1'","'r2v2'", 'NOW()'], ["'r3v1'","'r3v2'", 'NOW()']]
             >>> q.into_table('t1').columns(['t1c1','t1c2','t1c3']).set_batch_value(data).sql()
             "INSERT INTO t1 (`t1c1`, `t1c2`, `t1c3`) VALUES ('r1v1', 'r1v2', NOW()), ('r2v1', 'r2v2', NOW()), ('r3v1', 'r3v2', NOW())"
+
+        Raises:
+            ValueError: The statement is incompatible with batch values.
         """
+        if self._values or self._values_raw:
+            msg = "set_batch_value is incompatible with set_value and set_raw_value"
+            raise ValueError(msg)
+        if self._select:
+            msg = "set_batch_value is incompatible with INSERT...SELECT"
+            raise ValueError(msg)
+
         self._batch_values.extend(values)
+        self._invalidate_sql_cache()
         return self
 
     set_batch_values = set_batch_value
     """Alias for :py:meth:`set_batch_value`"""
 
+    @classmethod
+    def compile_template(
+        cls,
+        table_name: str,
+        columns: Collection[str],
+        ignore_error: bool = False,
+    ) -> Callable[[StmtParamValuesT], tuple[str, list]]:
+        """Precompile an INSERT statement for a fixed table and column set.
+
+        The returned callable takes a row's column values and returns
+        ``(SQL statement, parameterized values)``. The SQL skeleton is built
+        once, so hot bulk-insert loops only copy the value list per row.
+
+        Values are parameterized verbatim; use :py:class:`Insert` itself
+        when values need to be pickled or inlined.
+
+        Arguments:
+            table_name (string): Table to insert into.
+            columns (Collection): Column names, in row-value order.
+            ignore_error (bool, optional): Include IGNORE flag in statement.
+
+        Returns:
+            callable: ``(row_values) -> (SQL statement, parameterized values)``
+
+        Raises:
+            ValueError: Parameterization is disabled through :py:class:`mysqlstmt.config.Config`.
+
+        Examples: ::
+
+            >>> render = Insert.compile_template('t1', ('t1c1', 't1c2'))
+            >>> render((1, 2))
+            ('INSERT INTO t1 (`t1c1`, `t1c2`) VALUES (?, ?)', [1, 2])
+        """
+        placeholder = Config.placeholder
+        if not placeholder:
+            msg = "compile_template is parameterize-only and requires Config.placeholder to be set"
+            raise ValueError(msg)
+
+        quote_all = Config.quote_all_col_refs
+
+        col_clause = ", ".join(_quote_col_ref(quote_all, col) for col in columns)
+        values_clause = ", ".join([placeholder] * len(columns))
+        template = "INSERT " + ("IGNORE " if ignore_error else "") + "INTO " + table_name + " (" + col_clause + ") VALUES (" + values_clause + ")"  # noqa: S608
+
+        def render(row_values: StmtParamValuesT) -> tuple[str, list]:
+            return template, list(row_values)
+
+        return render
+
     def sql(self) -> SQLReturnT:  # noqa: C901, PLR0912, PLR0915
         """Build INSERT SQL statement.
 
@@ -191,6 +280,11 @@ class Insert(Stmt, SetValuesMixin):
         Raises:
             ValueError: The statement cannot be created with the given attributes.
         """
+        # The cache key includes the version of a SELECT child since it can be mutated independently.
+        cache_key = (self._sql_version, self._select._sql_version if isinstance(self._select, Select) else None)  # noqa: SLF001
+        if self._cached_sql is not None and self._cached_sql[0] == cache_key:
+            return self._fresh_sql_result(self._cached_sql[1])
+
         col_names = self._columns  # Be careful not to overwrite!
         param_values = []
 
@@ -277,10 +371,7 @@ class Insert(Stmt, SetValuesMixin):
                 sql.append(f"VALUES {', '.join(inline_values)}")
             else:
                 # ALL columns are parameterized
-                placeholder = str(self.placeholder)
-                inline_values = [placeholder for _ in range(len(col_names))]
-                assert len(col_names) == len(inline_values)
-                sql.append(f"VALUES ({', '.join(inline_values)})")
+                sql.append(f"VALUES ({', '.join([str(self.placeholder)] * len(col_names))})")
 
                 for row in self._batch_values:
                     row_param_value = []
@@ -308,6 +399,10 @@ class Insert(Stmt, SetValuesMixin):
             raise ValueError(msg)
 
         if self.placeholder:
-            return " ".join(sql), param_values if param_values else None
-        assert not param_values
-        return " ".join(sql)
+            result: SQLReturnT = (" ".join(sql), param_values if param_values else None)
+        else:
+            assert not param_values
+            result = " ".join(sql)
+
+        self._cached_sql = (cache_key, result)
+        return self._fresh_sql_result(result)
@@ -27,6 +27,8 @@ class JoinMixin(ABC):
         This class is not to be instantiated directly.
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs) -> None:
         """Constructor.
 
@@ -86,6 +88,7 @@ class JoinMixin(ABC):
                 self.join(table_factor, cond, _join_type)
         else:
             self._join_refs.append((_join_type, dict_or_table_factor, join_cond))
+            self._invalidate_sql_cache()
 
         return self
 
@@ -219,6 +222,13 @@ class JoinMixin(ABC):
 
             prev_join_table = join_table
 
+    @abstractmethod
+    def _invalidate_sql_cache(self) -> None:
+        """Mark the statement as modified so cached ``sql()`` results are rebuilt.
+
+        Implemented in `mysqlstmt.Stmt`.
+        """
+
     @abstractmethod
     def quote_col_ref(self, col_ref: str) -> str:
         """Quote column reference with backticks.
@@ -12,6 +12,8 @@ from .stmt import Stmt
 class Lock(Stmt):
     """SELECT GET_LOCK statement."""
 
+    __slots__ = ("_name", "_timeout")
+
     def __init__(self, name: str | None = None, timeout: int | None = None, **kwargs) -> None:
         """Constructor.
 
@@ -52,11 +54,11 @@ class Lock(Stmt):
             msg = "Lock timeout is required"
             raise ValueError(msg)
 
-        sql = ["SELECT", f"GET_LOCK({self.quote(self._name)}, {self._timeout})"]
+        sql = f"SELECT GET_LOCK({self.quote(self._name)}, {self._timeout})"
 
         if self.placeholder:
-            return " ".join(sql), None
-        return " ".join(sql)
+            return sql, None
+        return sql
 
     def release_lock(self) -> str | tuple[str, None]:
         """Build SELECT RELEASE_LOCK SQL statement.
@@ -78,11 +80,11 @@ class Lock(Stmt):
             msg = "Lock name is required"
             raise ValueError(msg)
 
-        sql = ["SELECT", f"RELEASE_LOCK({self.quote(self._name)})"]
+        sql = f"SELECT RELEASE_LOCK({self.quote(self._name)})"
 
         if self.placeholder:
-            return " ".join(sql), None
-        return " ".join(sql)
+            return sql, None
+        return sql
 
     def is_free_lock(self) -> str | tuple[str, None]:
         """Build SELECT IS_FREE_LOCK SQL statement.
@@ -104,11 +106,11 @@ class Lock(Stmt):
             msg = "Lock name is required"
             raise ValueError(msg)
 
-        sql = ["SELECT", f"IS_FREE_LOCK({self.quote(self._name)})"]
+        sql = f"SELECT IS_FREE_LOCK({self.quote(self._name)})"
 
         if self.placeholder:
-            return " ".join(sql), None
-        return " ".join(sql)
+            return sql, None
+        return sql
 
     sql = get_lock
     """Alias for :py:meth:`get_lock`."""
@@ -17,6 +17,8 @@ class Replace(Insert):
         ('REPLACE INTO t (`c1`) VALUES (1)', None)
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs) -> None:
         """Constructor.
 
@@ -54,6 +54,22 @@ class Select(Stmt, WhereMixin, JoinMixin):
         ('SELECT DISTINCT `t1c1` FROM t1', None)
     """
 
+    __slots__ = (
+        "_active_cond",
+        "_cached_sql",
+        "_groupby_conds",
+        "_having_cond_root",
+        "_join_refs",
+        "_limit",
+        "_orderby_conds",
+        "_select_col",
+        "_select_expr",
+        "_table_factors",
+        "_where_cond_root",
+        "cacheable",
+        "calc_found_rows",
+    )
+
     def __init__(
         self,
         table_name: str | Collection[str] | None = None,
@@ -83,6 +99,7 @@ class Select(Stmt, WhereMixin, JoinMixin):
         self._orderby_conds = []
         self._groupby_conds = []
         self._limit = None
+        self._cached_sql: tuple[int, SQLReturnT] | None = None
         self._having_cond_root = WhereCondition(self, where_predicate=having_predicate)
 
         if cacheable is False or Config.select_cacheable is False:
@@ -122,6 +139,7 @@ class Select(Stmt, WhereMixin, JoinMixin):
                 self.from_table(c)
         else:
             self._table_factors.append(list_or_name)
+            self._invalidate_sql_cache()
 
         return self
 
@@ -192,8 +210,10 @@ class Select(Stmt, WhereMixin, JoinMixin):
                 self.column(c, raw, value_params)
         elif raw is True:
             self._select_expr.append((list_or_name, value_params))
+            self._invalidate_sql_cache()
         elif list_or_name not in self._select_col:
             self._select_col.append(list_or_name)
+            self._invalidate_sql_cache()
 
         return self
 
@@ -257,6 +277,7 @@ class Select(Stmt, WhereMixin, JoinMixin):
             expr_alias = f" AS {list_or_name}"
             self._select_col = [c for c in self._select_col if c != list_or_name]
             self._select_expr = [c for c in self._select_expr if not c[0].endswith(expr_alias)]
+            self._invalidate_sql_cache()
 
         return self
 
@@ -290,6 +311,7 @@ class Select(Stmt, WhereMixin, JoinMixin):
         for i, col in enumerate(self._select_col):
             if (qualify_cols is None or col in qualify_cols) and "." not in col:
                 self._select_col[i] = f"{table_name}.{col}"
+                self._invalidate_sql_cache()
 
         return self
 
@@ -313,6 +335,7 @@ class Select(Stmt, WhereMixin, JoinMixin):
                 self.order_by(c)
         else:
             self._orderby_conds.append(list_or_name)
+            self._invalidate_sql_cache()
 
         return self
 
@@ -340,6 +363,7 @@ class Select(Stmt, WhereMixin, JoinMixin):
                 self.group_by(c)
         else:
             self._groupby_conds.append(list_or_name)
+            self._invalidate_sql_cache()
 
         return self
 
@@ -360,6 +384,7 @@ class Select(Stmt, WhereMixin, JoinMixin):
             ('SELECT * FROM t1 LIMIT 5', None)
         """
         self._limit = (row_count, offset)
+        self._invalidate_sql_cache()
         return self
 
     def having_value(
@@ -552,17 +577,17 @@ class Select(Stmt, WhereMixin, JoinMixin):
 
             >>> q = Select()
             >>> q.from_table('t1').having_or().having_value('t1c1', 3).having_value('t1c1', 5).sql()
-            ('SELECT * FROM t1 HAVING (`t1c1` = 3 OR `t1c1` = 5)', None)
+            ('SELECT * FROM t1 HAVING `t1c1` IN (3, 5)', None)
 
             >>> q = Select(having_predicate='AND')
             >>> q.from_table('t1').having_or().having_value('t1c1', 1).having_value('t1c1', 5). \
                 having_or().having_value('t1c1', 6).having_value('t1c1', 10).sql()
-            ('SELECT * FROM t1 HAVING ((`t1c1` = 1 OR `t1c1` = 5) AND (`t1c1` = 6 OR `t1c1` = 10))', None)
+            ('SELECT * FROM t1 HAVING (`t1c1` IN (1, 5) AND `t1c1` IN (6, 10))', None)
         """
         self._having_cond_root.where_or()
         return self
 
-    def sql(self) -> SQLReturnT:  # noqa: C901, PLR0912
+    def sql(self) -> SQLReturnT:  # noqa: C901, PLR0912, PLR0915
         """Build SELECT SQL statement.
 
         Returns:
@@ -572,6 +597,9 @@ class Select(Stmt, WhereMixin, JoinMixin):
         Raises:
             ValueError: The statement cannot be created with the given attributes.
         """
+        if self._cached_sql is not None and self._cached_sql[0] == self._sql_version:
+            return self._fresh_sql_result(self._cached_sql[1])
+
         table_refs = []
         param_values = []
 
@@ -661,6 +689,10 @@ class Select(Stmt, WhereMixin, JoinMixin):
                 sql.append(f"LIMIT {row_count}")
 
         if self.placeholder:
-            return " ".join(sql), param_values if param_values else None
-        assert not param_values
-        return " ".join(sql)
+            result: SQLReturnT = (" ".join(sql), param_values if param_values else None)
+        else:
+            assert not param_values
+            result = " ".join(sql)
+
+        self._cached_sql = (self._sql_version, result)
+        return self._fresh_sql_result(result)
@@ -6,6 +6,7 @@ This module provides:
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 from collections.abc import Collection, Mapping
 from typing import TYPE_CHECKING
 from typing import Union as UnionT
@@ -21,13 +22,15 @@ SetRawValueTupleT = tuple[str, UnionT[StmtParamValuesT, None]]
 SetRawValueT = UnionT[str, SetRawValueTupleT]
 
 
-class SetValuesMixin:
+class SetValuesMixin(ABC):
     """Provide set_value related functionality to statement classes.
 
     Note:
         This class is not to be instantiated directly.
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs) -> None:
         """Constructor.
 
@@ -97,6 +100,7 @@ class SetValuesMixin:
                 self.set_value(f, v)
         else:
             self._values[field_or_dict] = value
+            self._invalidate_sql_cache()
 
         return self
 
@@ -152,10 +156,19 @@ class SetValuesMixin:
         elif isinstance(value_or_tuple, tuple):
             assert len(value_or_tuple) == 2  # noqa: PLR2004
             self._values_raw[field_or_dict] = value_or_tuple
+            self._invalidate_sql_cache()
         else:
-            self.set_raw_value(field_or_dict, (value_or_tuple, value_params))
+            self._values_raw[field_or_dict] = (value_or_tuple, value_params)
+            self._invalidate_sql_cache()
 
         return self
 
     set_raw_values = set_raw_value
     """Alias for :py:meth:`set_raw_value`"""
+
+    @abstractmethod
+    def _invalidate_sql_cache(self) -> None:
+        """Mark the statement as modified so cached ``sql()`` results are rebuilt.
+
+        Implemented in `mysqlstmt.Stmt`.
+        """
@@ -7,6 +7,7 @@ This module provides:
 from __future__ import annotations
 
 import datetime
+import functools
 from collections.abc import Collection
 from typing import TYPE_CHECKING
 from typing import Union as UnionT
@@ -24,10 +25,52 @@ StmtParamValuesT = Collection[StmtParamValueT]
 ValueParamsT = Collection[str]
 SelectExprT = UnionT[str, Collection[str]]
 
+_PICKLE_NULL = ("NULL", False)
+_PICKLE_TRUE = ("1", False)
+_PICKLE_FALSE = ("0", False)
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote_col_ref(quote_all: bool, col_ref: str) -> str:
+    """Quote a column reference with backticks.
+
+    The cache is process-global; the same column names tend to appear many
+    times across statements, so quoting each distinct name happens once.
+    """
+    if quote_all:
+        if " " in col_ref:
+            return col_ref  # COLUMN AS ALIAS
+        if "(" in col_ref:
+            return col_ref  # FUNCTION(COLUMN)
+        if "`" in col_ref:
+            return col_ref  # already quoted
+
+        col_ref_parts = col_ref.split(".")
+        if len(col_ref_parts) > 1:
+            table, col = col_ref_parts
+            return table + ".`" + col + "`"
+        return "`" + col_ref + "`"
+
+    return col_ref
+
+
+@functools.lru_cache(maxsize=1024)
+def _table_alias(table_factor: str) -> str:
+    """Extract the alias from a ``table [AS alias]`` factor.
+
+    Cached so a table factor is only tokenized once per process, not on
+    every render that references it.
+    """
+    table_parts = table_factor.split("AS")
+    return table_factor if len(table_parts) == 1 else table_parts[1].strip()
+
 
 class Stmt:
     """Base class for all statement classes."""
 
+    # Mixins declare empty ``__slots__`` and list their attributes in the statement classes.
+    __slots__ = ("_sql_version", "placeholder", "query_options", "quote_all_col_refs", "quote_all_values")
+
     def __init__(
         self,
         placeholder: str | bool | None = None,
@@ -51,6 +94,10 @@ class Stmt:
             Default settings for ``placeholder``, ``quote_all_col_refs`` and ``quote_all_values``
             are set through :py:class:`mysqlstmt.config.Config`
         """
+        # Bumped by mutators so ``sql()`` implementations can cache their rendered statement.
+        # Set before the mixin constructors run since they can trigger an invalidation.
+        self._sql_version = 0
+
         super().__init__(**kwargs)
 
         if placeholder is None:
@@ -71,7 +118,7 @@ class Stmt:
             self.quote_all_col_refs = Config.quote_all_col_refs if quote_all_col_refs is None else quote_all_col_refs
 
         # Public properties
-        self.query_options = []  # can append with ``set_option``
+        self.query_options: dict[str, None] = {}  # ordered set of options added with ``set_option``
 
     def __call__(self, *args, **kwargs) -> SQLReturnT:  # noqa: ARG002
         """Returns SQL statement created by :py:meth:`sql`."""
@@ -95,6 +142,26 @@ class Stmt:
         """
         raise NotImplementedError
 
+    def _invalidate_sql_cache(self) -> None:
+        """Mark the statement as modified so cached :py:meth:`sql` results are rebuilt.
+
+        Mutators must call this so statement classes that cache their rendered SQL
+        know to discard it.
+        """
+        self._sql_version += 1
+
+    @staticmethod
+    def _fresh_sql_result(result: SQLReturnT) -> SQLReturnT:
+        """Return ``result`` with a fresh parameterized-values list.
+
+        Statement classes return their cached result on repeated :py:meth:`sql`
+        calls; handing out the stored list would let callers mutate the cache,
+        so every return gets its own copy.
+        """
+        if isinstance(result, tuple) and result[1] is not None:
+            return (result[0], list(result[1]))
+        return result
+
     def quote_col_ref(self, col_ref: str) -> str:
         """Quote column reference with backticks.
 
@@ -107,23 +174,9 @@ class Stmt:
         Notes:
             Column reference will not be quoted if it contains a backtick, space or parenthesis.
         """
-        if self.quote_all_col_refs:
-            if " " in col_ref:
-                return col_ref  # COLUMN AS ALIAS
-            if "(" in col_ref:
-                return col_ref  # FUNCTION(COLUMN)
-            if "`" in col_ref:
-                return col_ref  # already quoted
-
-            col_ref_parts = col_ref.split(".")
-            if len(col_ref_parts) > 1:
-                table, col = col_ref_parts
-                return f"{table}.`{col}`"
-            return f"`{col_ref}`"
-
-        return col_ref
-
-    def pickle(self, val: StmtPickleT) -> tuple[str, bool]:  # noqa: PLR0911
+        return _quote_col_ref(self.quote_all_col_refs, col_ref)
+
+    def pickle(self, val: StmtPickleT) -> tuple[str, bool]:  # noqa: C901, PLR0911
         """Convert variable value into a value that can be included in a SQL statement.
 
         Arguments:
@@ -133,23 +186,40 @@ class Stmt:
             tuple: (string, bool) Pickled value as a string and True if value should be parameterized.
         """
         if val is None:
-            return "NULL", False
+            return _PICKLE_NULL
         if val is True:
-            return "1", False
+            return _PICKLE_TRUE
         if val is False:
-            return "0", False
+            return _PICKLE_FALSE
         if isinstance(val, str):
             return val, True
         if isinstance(val, (int, float)):
             return str(val), False
         if isinstance(val, datetime.datetime):
-            return val.strftime("%Y-%m-%d %H:%M:%S"), True
+            # MySQL DATETIME has no UTC offset, so drop any tzinfo before formatting.
+            if val.tzinfo is not None:
+                val = val.replace(tzinfo=None)
+            return val.isoformat(" ", timespec="seconds"), True
         if isinstance(val, datetime.date):
-            return val.strftime("%Y-%m-%d"), True
+            return val.isoformat(), True
         if isinstance(val, datetime.time):
-            return val.strftime("%H:%M:%S"), True
+            if val.tzinfo is not None:
+                val = val.replace(tzinfo=None)
+            return val.isoformat(timespec="seconds"), True
         return str(val), True
 
+    def pickle_many(self, vals: Collection[StmtPickleT]) -> list[str]:
+        """Convert multiple values in one call to reduce per-value overhead.
+
+        Arguments:
+            vals (Collection): Values to pickle.
+
+        Returns:
+            list: Pickled values as strings; the parameterization flags are discarded.
+        """
+        pickle = self.pickle
+        return [pickle(val)[0] for val in vals]
+
     @staticmethod
     def quote(val: str) -> str:
         """Quotes a string with single quotemarks and adds backslashes to escape embedded single quotes.
@@ -177,8 +247,7 @@ class Stmt:
         Returns:
             string
         """
-        table_parts = table_factor.split("AS")
-        return table_factor if len(table_parts) == 1 else table_parts[1].strip()
+        return _table_alias(table_factor)
 
     def parameterize_values(
         self,
@@ -224,6 +293,8 @@ class Stmt:
     def set_option(self, list_or_value: str | Collection[str]) -> Self:
         """Sets query options (the keywords at the beginning of the SQL statement).
 
+        Duplicate options are ignored; options are emitted in the order they were first set.
+
         Arguments:
             list_or_value (mixed): An option or collection of options.
 
@@ -234,6 +305,7 @@ class Stmt:
             for val in list_or_value:
                 self.set_option(val)
         else:
-            self.query_options.append(list_or_value)
+            self.query_options[list_or_value] = None
+            self._invalidate_sql_cache()
 
         return self
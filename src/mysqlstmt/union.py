@@ -39,6 +39,8 @@ class Union(Stmt):
         ('(SELECT `t1c1` FROM t1) UNION (SELECT `t2c1` FROM t2)', None)
     """
 
+    __slots__ = ("_cached_sql", "_child_cache", "_distinct", "_limit", "_orderby_conds", "_selects")
+
     def __init__(self, list_or_stmt: str | Select | Collection[str | Select] | None = None, distinct: bool | None = None, **kwargs) -> None:
         """Constructor.
 
@@ -54,6 +56,8 @@ class Union(Stmt):
         self._distinct = distinct
         self._orderby_conds = []
         self._limit = None
+        self._cached_sql: tuple[tuple[int, tuple[int, ...]], SQLReturnT] | None = None
+        self._child_cache: dict[int, tuple[int, tuple[str, Collection[str] | None]]] = {}
 
         if list_or_stmt is not None:
             self.union(list_or_stmt)
@@ -81,11 +85,11 @@ class Union(Stmt):
             >>> sql_t = q.union(s1).union(s2).sql()
             ('(SELECT `t1c1` FROM t1) UNION (SELECT `t2c1` FROM t2)', None)
         """
-        if not isinstance(list_or_stmt, str) and not isinstance(list_or_stmt, Select):
-            for c in list_or_stmt:
-                self.union(c)
-        else:
+        if isinstance(list_or_stmt, (str, Select)):
             self._selects.append(list_or_stmt)
+        else:
+            self._selects.extend(list_or_stmt)
+        self._invalidate_sql_cache()
         return self
 
     select = union
@@ -106,12 +110,12 @@ class Union(Stmt):
             >>> sql_t = q.union('SELECT `t1c1` AS sort_col FROM t1').select('SELECT `t2c1` FROM t2').order_by('sort_col, DESC').sql()
             ('(SELECT `t1c1` AS sort_col FROM t1) UNION (SELECT `t2c1` FROM t2) ORDER BY sort_col, DESC', None)
         """
-        if not isinstance(list_or_name, str):
-            for c in list_or_name:
-                self.order_by(c)
-        else:
+        if isinstance(list_or_name, str):
             self._orderby_conds.append(list_or_name)
+        else:
+            self._orderby_conds.extend(list_or_name)
 
+        self._invalidate_sql_cache()
         return self
 
     def limit(self, row_count: int, offset: int = 0) -> Union:
@@ -131,6 +135,7 @@ class Union(Stmt):
             ('(SELECT `t1c1` AS sort_col FROM t1) UNION (SELECT `t2c1` FROM t2) ORDER BY sort_col, DESC LIMIT 5', None)
         """
         self._limit = (row_count, offset)
+        self._invalidate_sql_cache()
         return self
 
     def sql(self) -> SQLReturnT:  # noqa: C901, PLR0912
@@ -147,7 +152,28 @@ class Union(Stmt):
             msg = "No SELECT statements are specified"
             raise ValueError(msg)
 
-        sql = []
+        # Contained Select statements can be mutated directly, so their versions are part of the cache key.
+        cache_key = (self._sql_version, tuple(stmt._sql_version for stmt in self._selects if isinstance(stmt, Select)))  # noqa: SLF001
+        if self._cached_sql is not None and self._cached_sql[0] == cache_key:
+            return self._fresh_sql_result(self._cached_sql[1])
+
+        if len(self._selects) == 1 and not self._orderby_conds and self._limit is None and not self.query_options:
+            # Common single-SELECT case; no UNION keyword or clause handling needed.
+            stmt = self._selects[0]
+            if isinstance(stmt, Select):
+                stmtsql, select_params = stmt.sql()
+            else:
+                stmtsql, select_params = stmt, None
+
+            if self.placeholder:
+                result: SQLReturnT = ("(" + stmtsql + ")", select_params if select_params else None)
+            else:
+                assert not select_params
+                result = "(" + stmtsql + ")"
+
+            self._cached_sql = (cache_key, result)
+            return self._fresh_sql_result(result)
+
         param_values = []
 
         # MySQL SELECT syntax as of 5.7:
@@ -156,38 +182,42 @@ class Union(Stmt):
         # UNION [ALL | DISTINCT] SELECT ...
         # [UNION [ALL | DISTINCT] SELECT ...]
 
-        if self.query_options:
-            sql.extend(self.query_options)
+        sep = " UNION ALL " if self._distinct is False else " UNION "
+        parts = []
 
         for stmt in self._selects:
             if isinstance(stmt, Select):
-                select_sql, select_params = stmt.sql()
-                stmtsql = select_sql
+                # Re-rendering unchanged children is wasted work when sql() is called repeatedly.
+                cached_child = self._child_cache.get(id(stmt))
+                if cached_child is not None and cached_child[0] == stmt._sql_version:  # noqa: SLF001
+                    stmtsql, select_params = cached_child[1]
+                else:
+                    stmtsql, select_params = stmt.sql()
+                    self._child_cache[id(stmt)] = (stmt._sql_version, (stmtsql, select_params))  # noqa: SLF001
+
                 if select_params is not None:
                     param_values.extend(select_params)
             else:
                 stmtsql = stmt
 
-            if sql:
-                if self._distinct is False:
-                    sql.append("UNION ALL")
-                else:
-                    sql.append("UNION")
-
-            sql.append(f"({stmtsql})")
+            parts.append("(" + stmtsql + ")")
 
-        if self._orderby_conds:
-            sql.append("ORDER BY")
-            sql.append(", ".join(self._orderby_conds))
+        opts = " ".join(self.query_options) + " " if self.query_options else ""
+        orderby = f" ORDER BY {', '.join(self._orderby_conds)}" if self._orderby_conds else ""
 
+        limit = ""
         if self._limit is not None:
             row_count, offset = self._limit
-            if offset > 0:
-                sql.append(f"LIMIT {offset},{row_count}")
-            else:
-                sql.append(f"LIMIT {row_count}")
+            offset_prefix = f"{offset}," if offset > 0 else ""
+            limit = f" LIMIT {offset_prefix}{row_count}"
+
+        stmt_sql = f"{opts}{sep.join(parts)}{orderby}{limit}"
 
         if self.placeholder:
-            return " ".join(sql), param_values if param_values else None
-        assert not param_values
-        return " ".join(sql)
+            result: SQLReturnT = (stmt_sql, param_values if param_values else None)
+        else:
+            assert not param_values
+            result = stmt_sql
+
+        self._cached_sql = (cache_key, result)
+        return self._fresh_sql_result(result)
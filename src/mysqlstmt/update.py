@@ -8,15 +8,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .config import Config
 from .join_mixin import JoinMixin
 from .set_values_mixin import SetValuesMixin
-from .stmt import Stmt
+from .stmt import Stmt, _quote_col_ref
 from .where_mixin import WhereMixin
 
 if TYPE_CHECKING:
-    from collections.abc import Collection
+    from collections.abc import Callable, Collection
 
-    from .stmt import SQLReturnT
+    from .stmt import SQLReturnT, StmtParamValuesT
 
 
 class Update(Stmt, WhereMixin, JoinMixin, SetValuesMixin):
@@ -109,6 +110,19 @@ class Update(Stmt, WhereMixin, JoinMixin, SetValuesMixin):
         ('UPDATE LOW_PRIORITY t1 SET `t1c1`=1', None)
     """
 
+    __slots__ = (
+        "_active_cond",
+        "_cached_sql",
+        "_join_refs",
+        "_limit",
+        "_orderby_conds",
+        "_table_names",
+        "_values",
+        "_values_raw",
+        "_where_cond_root",
+        "ignore_error",
+    )
+
     def __init__(self, table_name: str | None = None, ignore_error: bool = False, **kwargs) -> None:
         """Constructor.
 
@@ -127,6 +141,7 @@ class Update(Stmt, WhereMixin, JoinMixin, SetValuesMixin):
         self._table_names: list[str] = []
         self._orderby_conds: list[str] = []
         self._limit = None
+        self._cached_sql: tuple[int, SQLReturnT] | None = None
 
         if table_name:
             self.table(table_name)
@@ -140,12 +155,12 @@ class Update(Stmt, WhereMixin, JoinMixin, SetValuesMixin):
         Returns:
             object: self
         """
-        if not isinstance(list_or_name, str):
-            for c in list_or_name:
-                self.table(c)
-        else:
+        if isinstance(list_or_name, str):
             self._table_names.append(list_or_name)
+        else:
+            self._table_names.extend(list_or_name)
 
+        self._invalidate_sql_cache()
         return self
 
     from_tables = table
@@ -160,12 +175,12 @@ class Update(Stmt, WhereMixin, JoinMixin, SetValuesMixin):
         Returns:
             object: self
         """
-        if not isinstance(list_or_name, str):
-            for c in list_or_name:
-                self.order_by(c)
-        else:
+        if isinstance(list_or_name, str):
             self._orderby_conds.append(list_or_name)
+        else:
+            self._orderby_conds.extend(list_or_name)
 
+        self._invalidate_sql_cache()
         return self
 
     def limit(self, row_count: int) -> Update:
@@ -178,9 +193,65 @@ class Update(Stmt, WhereMixin, JoinMixin, SetValuesMixin):
             object: self
         """
         self._limit = row_count
+        self._invalidate_sql_cache()
         return self
 
-    def sql(self) -> SQLReturnT:  # noqa: C901, PLR0912
+    @classmethod
+    def compile_template(
+        cls,
+        table_name: str,
+        set_cols: Collection[str],
+        where_cols: Collection[str] | None = None,
+        ignore_error: bool = False,
+    ) -> Callable[..., tuple[str, list]]:
+        """Precompile an UPDATE statement for a fixed table and column set.
+
+        The returned callable takes ``(set_values, where_values)`` and returns
+        ``(SQL statement, parameterized values)``. The SQL skeleton is built once,
+        so rendering in a hot loop only concatenates the value lists.
+
+        Values are parameterized verbatim; use :py:class:`Update` itself
+        when values need to be pickled or inlined.
+
+        Arguments:
+            table_name (string): Table to update.
+            set_cols (Collection): Column names for the SET clause, in order.
+            where_cols (Collection, optional): Column names compared for equality in the WHERE clause.
+            ignore_error (bool, optional): Include IGNORE flag in statement.
+
+        Returns:
+            callable: ``(set_values, where_values) -> (SQL statement, parameterized values)``
+
+        Raises:
+            ValueError: Parameterization is disabled through :py:class:`mysqlstmt.config.Config`.
+
+        Examples: ::
+
+            >>> render = Update.compile_template('t1', ('t1c1', 't1c2'), ('t1c3',))
+            >>> render((1, 2), (3,))
+            ('UPDATE t1 SET `t1c1`=?, `t1c2`=? WHERE `t1c3` = ?', [1, 2, 3])
+        """
+        placeholder = Config.placeholder
+        if not placeholder:
+            msg = "compile_template is parameterize-only and requires Config.placeholder to be set"
+            raise ValueError(msg)
+
+        quote_all = Config.quote_all_col_refs
+
+        set_clause = ", ".join(_quote_col_ref(quote_all, col) + "=" + placeholder for col in set_cols)
+        template = "UPDATE " + ("IGNORE " if ignore_error else "") + table_name + " SET " + set_clause  # noqa: S608
+
+        if where_cols:
+            where_exprs = [_quote_col_ref(quote_all, col) + " = " + placeholder for col in where_cols]
+            where_clause = where_exprs[0] if len(where_exprs) == 1 else "(" + " AND ".join(where_exprs) + ")"
+            template += " WHERE " + where_clause
+
+        def render(set_values: StmtParamValuesT, where_values: StmtParamValuesT = ()) -> tuple[str, list]:
+            return template, [*set_values, *where_values]
+
+        return render
+
+    def sql(self) -> SQLReturnT:  # noqa: C901, PLR0912, PLR0915
         """Build UPDATE SQL statement.
 
         Returns:
@@ -190,6 +261,9 @@ class Update(Stmt, WhereMixin, JoinMixin, SetValuesMixin):
         Raises:
             ValueError: The statement cannot be created with the given attributes.
         """
+        if self._cached_sql is not None and self._cached_sql[0] == self._sql_version:
+            return self._fresh_sql_result(self._cached_sql[1])
+
         if not self._table_names:
             msg = "UPDATE requires at least one table"
             raise ValueError(msg)
@@ -197,29 +271,26 @@ class Update(Stmt, WhereMixin, JoinMixin, SetValuesMixin):
             msg = "UPDATE requires at least one value"
             raise ValueError(msg)
 
-        table_refs = [", ".join(self._table_names)]
+        table_refs = [self._table_names[0]] if len(self._table_names) == 1 else [", ".join(self._table_names)]
         param_values = []
-        col_names = []
-        inline_values = []
         set_values = []
 
         self._append_join_table_refs(self._table_names[0], table_refs)
 
         if self._values:
+            inline_values = []
             for col, val in self._values.items():
-                col_names.append(col)
                 self.parameterize_values(val, inline_values, param_values)
+                set_values.append(self.quote_col_ref(col) + "=" + inline_values[-1])
 
-        for col in self._values_raw:
-            val, val_params = self._values_raw[col]
-            col_names.append(col)
-            inline_values.append(val)
-            if val_params is not None and self.placeholder:
-                param_values.extend(val_params)
-
-        assert len(col_names) == len(inline_values)
-        for col, val in zip(col_names, inline_values):
-            set_values.append(f"{self.quote_col_ref(col)}={val}")
+        if self.placeholder:
+            for col, (val, val_params) in self._values_raw.items():
+                if val_params is not None:
+                    param_values.extend(val_params)
+                set_values.append(self.quote_col_ref(col) + "=" + val)
+        else:
+            for col, (val, _val_params) in self._values_raw.items():
+                set_values.append(self.quote_col_ref(col) + "=" + val)
 
         # MySQL UPDATE syntax as of 5.7:
         #
@@ -245,7 +316,7 @@ class Update(Stmt, WhereMixin, JoinMixin, SetValuesMixin):
         if self.ignore_error:
             sql.append("IGNORE")
 
-        sql.append(" ".join(table_refs))
+        sql.append(table_refs[0] if len(table_refs) == 1 else " ".join(table_refs))
 
         sql.append("SET")
         sql.append(", ".join(set_values))
@@ -255,8 +326,10 @@ class Update(Stmt, WhereMixin, JoinMixin, SetValuesMixin):
             sql.append("WHERE")
             sql.append(where_cond)
 
+        is_multi_table = len(self._table_names) + len(self._join_refs) > 1
+
         if self._orderby_conds:
-            if len(self._table_names) + len(self._join_refs) > 1:
+            if is_multi_table:
                 msg = "Multiple-table UPDATE does not support ORDER BY"
                 raise ValueError(msg)
 
@@ -264,13 +337,17 @@ class Update(Stmt, WhereMixin, JoinMixin, SetValuesMixin):
             sql.append(", ".join(self._orderby_conds))
 
         if self._limit:
-            if len(self._table_names) + len(self._join_refs) > 1:
+            if is_multi_table:
                 msg = "Multiple-table UPDATE does not support LIMIT"
                 raise ValueError(msg)
 
             sql.append(f"LIMIT {self._limit}")
 
         if self.placeholder:
-            return " ".join(sql), param_values if param_values else None
-        assert not param_values
-        return " ".join(sql)
+            result: SQLReturnT = (" ".join(sql), param_values if param_values else None)
+        else:
+            assert not param_values
+            result = " ".join(sql)
+
+        self._cached_sql = (self._sql_version, result)
+        return self._fresh_sql_result(result)
@@ -6,7 +6,7 @@ This module provides:
 
 from __future__ import annotations
 
-from collections.abc import Collection, Mapping
+from collections.abc import Collection, Hashable, Mapping
 from typing import TYPE_CHECKING, Literal
 from typing import Union as UnionT
 
@@ -23,12 +23,86 @@ WherePredT = Literal["AND", "OR"]
 WhereValueT = UnionT[StmtPickleT, Collection[StmtPickleT]]
 WhereRawValueT = str
 
-WhereFieldConditionT = tuple[WhereValueT, WhereOpT]
+WhereFieldConditionT = tuple[WhereValueT, WhereOpT, int]
 WhereFieldConditionRawT = tuple[WhereRawValueT, WhereOpT, UnionT[StmtParamValuesT, None]]
 
 WhereExprValuesT = tuple[str, UnionT[ValueParamsT, None]]
 WhereExprT = UnionT[str, ValueParamsT]
 
+_PREDICATE_SQL = {"AND": " AND ", "OR": " OR "}
+
+# Operator rewrites applied while rendering.
+_IN_REWRITE = {"=": "IN", "<>": "NOT IN"}  # multi-value comparison
+_EQ_REWRITE = {"IN": "=", "NOT IN": "<>"}  # single-value IN
+_NULL_REWRITE = {"=": "IS", "<>": "IS NOT"}  # NULL comparison
+
+_NULL_LITERALS = frozenset(("NULL", "NOT NULL"))
+
+# Static selectivity ranks for ``reorder``: equality first, then IN,
+# ranges, inequality, LIKE, and everything else last.
+_OP_SELECTIVITY = {"=": 0, "IS": 0, "IN": 1, "<": 2, ">": 2, "<=": 2, ">=": 2, "<>": 3, "LIKE": 4}
+
+# Value shapes, classified once when the value is stored so rendering
+# branches on an int instead of repeating ABC isinstance checks.
+_SHAPE_SCALAR = 0
+_SHAPE_SEQ_MANY = 1
+_SHAPE_SEQ_ONE = 2
+
+
+def _value_shape(val: WhereValueT | None) -> int:
+    """Classify a comparison value as scalar, single-item sequence or multi-item sequence."""
+    # Exact-type checks short-circuit the ABC isinstance dispatch for the common scalars.
+    cls = val.__class__
+    if cls is str or cls is int or cls is float or cls is bool or val is None:
+        return _SHAPE_SCALAR
+    if isinstance(val, Collection) and not isinstance(val, str):
+        return _SHAPE_SEQ_MANY if len(val) > 1 else _SHAPE_SEQ_ONE
+    return _SHAPE_SCALAR
+
+
+def _collapse_or_equalities(entries: list[tuple[str, WhereFieldConditionT]]) -> list[tuple[str, WhereFieldConditionT]]:
+    """Collapse repeated equality tests on a field into a single IN comparison.
+
+    ``a = 1 OR a = 2 OR a = 3`` renders as ``a IN (1, 2, 3)``, which is fewer
+    tokens for the server to parse and lets it use an index range scan.
+    Only scalar, non-NULL '=' entries are grouped; other operators are left
+    alone since e.g. ``a <> 1 OR a <> 2`` is not equivalent to ``a NOT IN (1, 2)``.
+    """
+    eq_counts: dict[str, int] = {}
+    for field, (val, op, shape) in entries:
+        if op == "=" and shape == _SHAPE_SCALAR and val is not None:
+            eq_counts[field] = eq_counts.get(field, 0) + 1
+
+    if not any(n > 1 for n in eq_counts.values()):
+        return entries
+
+    grouped: dict[str, list[StmtPickleT]] = {}
+    collapsed: list[tuple[str, WhereFieldConditionT | None]] = []
+
+    for field, value_op in entries:
+        val, op, shape = value_op
+        if op == "=" and shape == _SHAPE_SCALAR and val is not None and eq_counts[field] > 1:
+            vals = grouped.get(field)
+            if vals is None:
+                # The group renders at the first occurrence of the field.
+                grouped[field] = [val]  # pyright: ignore[reportArgumentType]
+                collapsed.append((field, None))
+            elif val not in vals:
+                # Repeated identical equalities fold into one IN member.
+                vals.append(val)  # pyright: ignore[reportArgumentType]
+        else:
+            collapsed.append((field, value_op))
+
+    result: list[tuple[str, WhereFieldConditionT]] = []
+    for field, value_op in collapsed:
+        if value_op is None:
+            vals = grouped[field]
+            # Deduplication can leave a single member, which renders as '='.
+            result.append((field, (vals, "=", _SHAPE_SEQ_MANY if len(vals) > 1 else _SHAPE_SEQ_ONE)))
+        else:
+            result.append((field, value_op))
+    return result
+
 
 class WhereCondition:
     """Condition statements that can be used for WHERE and HAVING clauses.
@@ -38,12 +112,30 @@ class WhereCondition:
     ``WhereCondition`` objects.
     """
 
-    def __init__(self, stmt: WhereMixin, where_predicate: WherePredT | None = None, **kwargs) -> None:
+    __slots__ = (
+        "_conds",
+        "_nesting_level",
+        "_own_expr_count",
+        "_predicate",
+        "_raw_exprs",
+        "_render_cache",
+        "_reorder",
+        "_seen_exprs",
+        "_seen_values",
+        "_stmt",
+        "_values",
+        "_values_raw",
+    )
+
+    def __init__(self, stmt: WhereMixin, where_predicate: WherePredT | None = None, reorder: bool = False, **kwargs) -> None:
         """Constructor.
 
         Keyword Arguments:
             stmt (WhereMixin): Statement this condition is associated with.
             where_predicate (string, optional): The predicate for this condition, either 'AND' or 'OR'.
+            reorder (bool, optional): Emit this condition's value comparisons ordered by a static
+                selectivity heuristic (equality first, then IN, ranges, inequality and LIKE)
+                instead of insertion order. Default is False.
             **kwargs: Base class arguments.
         """
         super().__init__(**kwargs)
@@ -76,8 +168,22 @@ class WhereCondition:
 
         self._conds: list[WhereCondition] = []
         self._raw_exprs: list[WhereExprValuesT] = []
-        self._predicate = f" {where_predicate} "
+        self._predicate = _PREDICATE_SQL[where_predicate]
         self._nesting_level = 0
+        self._reorder = reorder
+
+        # Number of values/exprs set directly on this condition, maintained
+        # incrementally so ``expr_count`` does not rescan the containers.
+        self._own_expr_count = 0
+
+        # Lazily created insertion-dedup keys; repeating an identical raw
+        # expression or 'OR' value comparison would render redundant SQL.
+        self._seen_exprs: set | None = None
+        self._seen_values: set | None = None
+
+        # Rendered SQL and the params it contributed, keyed by the owning
+        # statement's version counter so any mutation invalidates it.
+        self._render_cache: tuple[int, str | None, list[str]] | None = None
 
     @property
     def expr_count(self) -> int:
@@ -86,7 +192,7 @@ class WhereCondition:
         Returns:
             int: Number of values and conditions that will result in an expression.
         """
-        c = len(self._values) + len(self._values_raw) + len(self._raw_exprs)
+        c = self._own_expr_count
         for cond in self._conds:
             if cond.has_conds:
                 c += 1
@@ -99,11 +205,25 @@ class WhereCondition:
         Returns:
             bool: True if this condition has value or conditions that will result in an expression, otherwise False.
         """
-        if self._values or self._values_raw or self._raw_exprs:
+        if self._own_expr_count:
             return True
 
         return any(cond.has_conds for cond in self._conds)
 
+    @property
+    def is_empty(self) -> bool:
+        """Check if anything has been added to this condition.
+
+        Returns:
+            bool: True if no values, expressions or subconditions have been added, otherwise False.
+        """
+        return not self._own_expr_count and not self._conds
+
+    @property
+    def predicate(self) -> str:
+        """The predicate for this condition, either 'AND' or 'OR'."""
+        return self._predicate.strip()
+
     @property
     def nesting_level(self) -> int:
         """The nesting_level of this condition.
@@ -115,11 +235,13 @@ class WhereCondition:
 
     @nesting_level.setter
     def nesting_level(self, value: int) -> None:
-        self._nesting_level = value
-
-        # Set nesting level for subconditions
-        for cond in self._conds:
-            cond.nesting_level = self._nesting_level + 1
+        # Set nesting level for subconditions, iteratively so deep trees
+        # do not pay a Python call frame per descendant.
+        stack: list[tuple[WhereCondition, int]] = [(self, value)]
+        while stack:
+            node, level = stack.pop()
+            node._nesting_level = level  # noqa: SLF001
+            stack.extend((cond, level + 1) for cond in node._conds)  # noqa: SLF001
 
     def get_where_cond(self, index: int = -1) -> WhereCondition:
         """Returns a ``WhereCondition`` object from the list of conditions.
@@ -158,9 +280,17 @@ class WhereCondition:
         """
         if cond is None:
             cond = WhereCondition(self._stmt, where_predicate=where_predicate)
-        assert isinstance(cond, WhereCondition)
+        elif cond._stmt is not self._stmt:
+            # Reparent conditions built against another statement so their
+            # mutators invalidate this statement's cached SQL.
+            stack = [cond]
+            while stack:
+                node = stack.pop()
+                node._stmt = self._stmt  # noqa: SLF001
+                stack.extend(node._conds)  # noqa: SLF001
         cond.nesting_level = self.nesting_level + 1
         self._conds.append(cond)
+        self._stmt._invalidate_sql_cache()  # noqa: SLF001
         return self
 
     def where_and(self) -> WhereCondition:
@@ -185,7 +315,7 @@ class WhereCondition:
         """
         return self.add_cond(where_predicate="OR")
 
-    def where_value(
+    def where_value(  # noqa: C901, PLR0912
         self,
         field_or_dict: str | Mapping[str, WhereValueT],
         value: WhereValueT | None = None,
@@ -210,16 +340,48 @@ class WhereCondition:
         Returns:
             object: self
         """
-        assert isinstance(field_or_dict, (str, dict))
-        assert isinstance(operator, str)
-
-        if isinstance(field_or_dict, Mapping):
-            for f, v in field_or_dict.items():
-                self.where_value(f, v, operator)
-        elif isinstance(self._values, dict):
-            self._values[field_or_dict] = (value, operator)
+        # Scalar field names are the common case, and a concrete str check is
+        # much cheaper than the Mapping ABC walk, so test for them first.
+        if isinstance(field_or_dict, str):
+            if isinstance(self._values, dict):
+                if field_or_dict not in self._values:
+                    self._own_expr_count += 1
+                self._values[field_or_dict] = (value, operator, _value_shape(value))
+            else:
+                shape = _value_shape(value)
+                if shape == _SHAPE_SCALAR and isinstance(value, Hashable):
+                    key = (field_or_dict, value, operator)
+                    seen = self._seen_values
+                    if seen is None:
+                        seen = self._seen_values = set()
+                    if key in seen:
+                        return self
+                    seen.add(key)
+                self._values.append((field_or_dict, (value, operator, shape)))
+                self._own_expr_count += 1
+            self._stmt._invalidate_sql_cache()  # noqa: SLF001
         else:
-            self._values.append((field_or_dict, (value, operator)))
+            # Write entries directly instead of recursing per item.
+            if isinstance(self._values, dict):
+                values = self._values
+                for f, v in field_or_dict.items():
+                    if f not in values:
+                        self._own_expr_count += 1
+                    values[f] = (v, operator, _value_shape(v))
+            else:
+                seen = self._seen_values
+                if seen is None:
+                    seen = self._seen_values = set()
+                for f, v in field_or_dict.items():
+                    shape = _value_shape(v)
+                    if shape == _SHAPE_SCALAR and isinstance(v, Hashable):
+                        key = (f, v, operator)
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                    self._values.append((f, (v, operator, shape)))
+                    self._own_expr_count += 1
+            self._stmt._invalidate_sql_cache()  # noqa: SLF001
 
         return self
 
@@ -250,21 +412,38 @@ class WhereCondition:
         Returns:
             object: self
         """
-        assert isinstance(field_or_dict, (str, dict))
-        assert raw_value is None or isinstance(raw_value, (str, tuple))
-        assert isinstance(operator, str)
-        assert value_params is None or isinstance(value_params, Collection)
-
-        if isinstance(field_or_dict, Mapping):
-            for f, v in field_or_dict.items():
-                self.where_raw_value(f, v)
-        elif raw_value is None:
-            errmsg = "Raw value cannot be 'None'"
-            raise ValueError(errmsg)
-        elif isinstance(self._values_raw, dict):
-            self._values_raw[field_or_dict] = (raw_value, operator, value_params)
+        # Scalar field names are the common case, and a concrete str check is
+        # much cheaper than the Mapping ABC walk, so test for them first.
+        if isinstance(field_or_dict, str):
+            if raw_value is None:
+                errmsg = "Raw value cannot be 'None'"
+                raise ValueError(errmsg)
+            if value_params is not None and not isinstance(value_params, tuple):
+                # Freeze caller sequences so later mutation cannot change the rendered params.
+                value_params = tuple(value_params)
+            if isinstance(self._values_raw, dict):
+                if field_or_dict not in self._values_raw:
+                    self._own_expr_count += 1
+                self._values_raw[field_or_dict] = (raw_value, operator, value_params)
+            else:
+                self._values_raw.append((field_or_dict, (raw_value, operator, value_params)))
+                self._own_expr_count += 1
+            self._stmt._invalidate_sql_cache()  # noqa: SLF001
         else:
-            self._values_raw.append((field_or_dict, (raw_value, operator, value_params)))
+            # Write entries directly instead of recursing per item.
+            if None in field_or_dict.values():
+                errmsg = "Raw value cannot be 'None'"
+                raise ValueError(errmsg)
+            if isinstance(self._values_raw, dict):
+                values_raw = self._values_raw
+                for f, v in field_or_dict.items():
+                    if f not in values_raw:
+                        self._own_expr_count += 1
+                    values_raw[f] = (v, "=", None)
+            else:
+                self._values_raw.extend((f, (v, "=", None)) for f, v in field_or_dict.items())
+                self._own_expr_count += len(field_or_dict)
+            self._stmt._invalidate_sql_cache()  # noqa: SLF001
 
         return self
 
@@ -286,17 +465,71 @@ class WhereCondition:
         Returns:
             object: self
         """
-        assert expr_params is None or isinstance(expr_params, Collection)
+        seen = self._seen_exprs
+        if seen is None:
+            seen = self._seen_exprs = set()
 
         if not isinstance(expr_or_list, str):
+            # Write entries directly instead of recursing per item.
             for expr in expr_or_list:
-                self.where_expr(expr)
+                key = (expr, None)
+                if key in seen:
+                    continue
+                seen.add(key)
+                self._raw_exprs.append((expr, None))
+                self._own_expr_count += 1
+            self._stmt._invalidate_sql_cache()  # noqa: SLF001
         else:
-            self._raw_exprs.append((expr_or_list, expr_params))
+            if expr_params is not None and not isinstance(expr_params, tuple):
+                # Freeze caller sequences so later mutation cannot change the rendered params.
+                expr_params = tuple(expr_params)
+            key = (expr_or_list, expr_params)
+            if key not in seen:
+                seen.add(key)
+                self._raw_exprs.append((expr_or_list, expr_params))
+                self._own_expr_count += 1
+                self._stmt._invalidate_sql_cache()  # noqa: SLF001
 
         return self
 
-    def sql(self, param_values: list[str]) -> str | None:  # noqa: C901, PLR0912, PLR0915
+    def _resolve_empty_sequences(self) -> str | None:
+        """Resolve comparisons against empty sequences before rendering.
+
+        ``IN ()`` is always false and ``NOT IN ()`` always true, so such
+        entries either decide this condition outright or drop out as neutral.
+
+        Returns:
+            '0' or '1' if the whole condition folds to a constant, otherwise None.
+        """
+        values = self._values
+
+        if isinstance(values, dict):  # 'AND' storage
+            empties = [f for f, vo in values.items() if vo[2] and isinstance(vo[0], Collection) and not vo[0]]
+            for f in empties:
+                if values[f][1] not in ("<>", "NOT IN"):
+                    return "0"  # always-false conjunct; the whole condition is false
+                # 'NOT IN ()' is always true and neutral in a conjunction
+                del values[f]
+                self._own_expr_count -= 1
+        else:  # 'OR' storage
+            kept = []
+            dropped = False
+            for entry in values:
+                vo = entry[1]
+                if vo[2] and isinstance(vo[0], Collection) and not vo[0]:
+                    if vo[1] in ("<>", "NOT IN"):
+                        return "1"  # always-true disjunct; the whole condition is true
+                    # 'IN ()' is always false and neutral in a disjunction
+                    self._own_expr_count -= 1
+                    dropped = True
+                    continue
+                kept.append(entry)
+            if dropped:
+                self._values = kept
+
+        return None
+
+    def sql(self, param_values: list[str]) -> str | None:
         """Build SQL snippet to include in a WHERE or HAVING clause.
 
         Args:
@@ -310,83 +543,157 @@ class WhereCondition:
             You won't need to use this function unless you're just curious about the SQL
             it creates.
         """
-        sql = []
+        if not self.has_conds:
+            return None
 
-        for cond in self._conds:
-            cond_sql = cond.sql(param_values)
-            if cond_sql:
-                sql.append(cond_sql)
-
-        for field_or_tuple in self._values:
-            if not isinstance(field_or_tuple, str):
-                # > OR = tuple
-                field, value_op_tuple = field_or_tuple
-                val, op = value_op_tuple
-            elif isinstance(self._values, dict):
-                # > AND = dict key
-                val, op = self._values[field_or_tuple]
-                field = field_or_tuple
+        version = self._stmt._sql_version  # noqa: SLF001
+        cached = self._render_cache
+        if cached is not None and cached[0] == version:
+            param_values.extend(cached[2])
+            return cached[1]
+
+        if not self._conds:
+            # Typical flat condition (e.g. a single ``where_value``); nothing to
+            # traverse, so render this node directly.
+            params_start = len(param_values)
+            result = self._resolve_empty_sequences()
+            if result is None:
+                body, expr_n = self._render_node(param_values, {})
+                result = f"({body})" if body is not None and expr_n > 1 else body
+            self._render_cache = (version, result, param_values[params_start:])
+            return result
+
+        # Iterative post-order traversal: children are rendered before their parent,
+        # left to right so parameter values append in the same order as recursion would,
+        # without a Python call frame per nested condition. Empty subtrees are pruned.
+        # Parents splice same-predicate child bodies in without parentheses, so
+        # ``a AND (b AND c)`` renders as ``a AND b AND c`` without mutating the tree.
+        rendered: dict[int, tuple[str | None, int]] = {}
+        stack: list[tuple[WhereCondition, bool]] = [(self, False)]
+        params_start = len(param_values)
+
+        while stack:
+            node, visited = stack.pop()
+            if visited:
+                rendered[id(node)] = node._render_node(param_values, rendered)  # noqa: SLF001
             else:
-                errmsg = "WhereCondition expected a tuple or string dictionary key"
-                raise TypeError(errmsg)
+                const = node._resolve_empty_sequences()  # noqa: SLF001
+                if const is not None:
+                    # Constant nodes contribute no params, so their subtrees are skipped.
+                    rendered[id(node)] = (const, 1)
+                    continue
+                stack.append((node, True))
+                stack.extend((cond, False) for cond in reversed(node._conds) if cond.has_conds)  # noqa: SLF001
+
+        body, expr_n = rendered[id(self)]
+        result = f"({body})" if body is not None and expr_n > 1 else body
+        self._render_cache = (version, result, param_values[params_start:])
+        return result
+
+    def _render_node(self, param_values: list[str], rendered: Mapping[int, tuple[str | None, int]]) -> tuple[str | None, int]:  # noqa: C901, PLR0912, PLR0915
+        """Render this condition using already-rendered subconditions.
 
-            field = self._stmt.quote_col_ref(field)
-            inline_values = []
+        Args:
+            param_values (list, modified): List to append parameterized values to.
+            rendered (Mapping): ``(body, expression count)`` for each subcondition, keyed by ``id()``.
 
-            self._stmt.parameterize_values(val, inline_values, param_values)
+        Returns:
+            tuple: ``(body, expression count)`` where ``body`` is SQL without enclosing
+            parentheses, or ``None`` if the condition is empty. Callers parenthesize
+            when the count is greater than one and the body is not spliced into a
+            same-predicate parent.
+        """
+        # Expressions are appended as interleaved tokens and joined once at the end.
+        parts = []
+        append = parts.append
+        predicate = self._predicate
+        expr_n = 0
+
+        # Hoist the per-field statement lookups out of the loops.
+        stmt = self._stmt
+        quote_col_ref = stmt.quote_col_ref
+        parameterize_values = stmt.parameterize_values
+        placeholder = stmt.placeholder
+        # Specialize on the storage form picked in the constructor:
+        # 'AND' stores field: value dicts, 'OR' stores (field, value) tuples.
+        # Both iterate as (field, value) pairs.
+        if isinstance(self._values, dict):
+            values_items = self._values.items()
+        elif len(self._values) > 1:
+            # 'OR' storage can repeat a field; merge repeated equalities into IN.
+            values_items = _collapse_or_equalities(self._values)
+        else:
+            values_items = self._values
+        values_raw_items = self._values_raw.items() if isinstance(self._values_raw, dict) else self._values_raw
 
-            if isinstance(val, Collection) and not isinstance(val, str):
-                # Force lists and tuples to be an IN statement
-                if len(val) > 1:
-                    val = f"({', '.join(inline_values)})"
-                    if op == "=":
-                        op = "IN"
-                    elif op == "<>":
-                        op = "NOT IN"
-                else:
-                    # Simplify 'FIELD IN (VALUE)' to 'FIELD = VALUE'
-                    val = inline_values[0]
-                    if op == "IN":
-                        op = "="
-                    elif op == "NOT IN":
-                        op = "<>"
-            else:
-                val = inline_values[0]
+        if self._reorder:
+            # Stable sort, so equally ranked comparisons keep insertion order.
+            values_items = sorted(values_items, key=lambda fv: _OP_SELECTIVITY.get(fv[1][1], 5))
 
-            if val in ("NULL", "NOT NULL"):
-                if op == "=":
-                    op = "IS"
-                elif op == "<>":
-                    op = "IS NOT"
-
-            sql.append(f"{field} {op} {val}")
-
-        for field_or_tuple in self._values_raw:
-            if not isinstance(field_or_tuple, str):
-                field, value_op_tuple = field_or_tuple
-                val, op, val_params = value_op_tuple
-            elif isinstance(self._values_raw, dict):
-                val, op, val_params = self._values_raw[field_or_tuple]
-                field = field_or_tuple
+        for cond in self._conds:
+            centry = rendered.get(id(cond))
+            if centry is None:
+                continue
+            cond_sql, cond_n = centry
+            if not cond_sql:
+                continue
+            if parts:
+                append(predicate)
+            if cond._predicate == predicate:  # noqa: SLF001
+                # Same-predicate subcondition: splice its body in unparenthesized.
+                append(cond_sql)
+                expr_n += cond_n
             else:
-                errmsg = "WhereCondition expected a tuple or string dictionary key"
-                raise TypeError(errmsg)
+                append(f"({cond_sql})" if cond_n > 1 else cond_sql)
+                expr_n += 1
 
-            if val_params is not None and self._stmt.placeholder:
-                for param_val in val_params:
-                    pickled_val, can_paramize_val = self._stmt.pickle(param_val)
-                    param_values.append(pickled_val)
+        for field, value_op in values_items:
+            val, op, shape = value_op
+            field_sql = quote_col_ref(field)
+            inline_values = []
 
-            sql.append(f"{self._stmt.quote_col_ref(field)} {op} {val}")
+            parameterize_values(val, inline_values, param_values)
 
-        for expr_tuple in self._raw_exprs:
-            expr, expr_params = expr_tuple
-            sql.append(expr)
-            if expr_params is not None and self._stmt.placeholder:
-                param_values.extend(expr_params)
+            if shape == _SHAPE_SEQ_MANY:
+                # Force lists and tuples to be an IN statement
+                val = f"({', '.join(inline_values)})"
+                op = _IN_REWRITE.get(op, op)
+            elif shape == _SHAPE_SEQ_ONE:
+                # Simplify 'FIELD IN (VALUE)' to 'FIELD = VALUE'
+                val = inline_values[0]
+                op = _EQ_REWRITE.get(op, op)
+            else:
+                val = inline_values[0]
 
-        if not sql:
-            return None
-        if self.expr_count > 1:
-            return f"({self._predicate.join(sql)})"
-        return f"{self._predicate.join(sql)}"
+            if val in _NULL_LITERALS:
+                op = _NULL_REWRITE.get(op, op)
+
+            if parts:
+                append(predicate)
+            parts.extend((field_sql, " ", op, " ", val))
+            expr_n += 1
+
+        if self._values_raw:
+            # Raw values need no per-item branching, so the whole group is built
+            # with one join and its params with one generator-driven extend.
+            if placeholder:
+                param_values.extend(p for _f, (_v, _op, vp) in values_raw_items if vp is not None for p in stmt.pickle_many(vp))
+
+            if parts:
+                append(predicate)
+            append(predicate.join([quote_col_ref(f) + " " + op + " " + val for f, (val, op, _vp) in values_raw_items]))
+            expr_n += len(self._values_raw)
+
+        if self._raw_exprs:
+            if placeholder:
+                param_values.extend(p for _expr, expr_params in self._raw_exprs if expr_params is not None for p in expr_params)
+
+            if parts:
+                append(predicate)
+            append(predicate.join([expr for expr, _params in self._raw_exprs]))
+            expr_n += len(self._raw_exprs)
+
+        if not parts:
+            return None, 0
+        # Each value, raw expr and non-spliced subcondition counts as one expression.
+        return "".join(parts), expr_n
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
     from .stmt import StmtParamValuesT, ValueParamsT
     from .where_condition import WhereExprT, WhereOpT, WherePredT, WhereRawValueT, WhereValueT
 
+_VALID_PREDICATES = frozenset(("AND", "OR"))
+
 
 class WhereMixin:
     """Provide where_value related functionality to statement classes.
@@ -26,6 +28,8 @@ class WhereMixin:
         This class is not to be instantiated directly.
     """
 
+    __slots__ = ()
+
     def __init__(self, where_predicate: str = "OR", **kwargs) -> None:
         """Constructor.
 
@@ -35,12 +39,17 @@ class WhereMixin:
         """
         super().__init__(**kwargs)
 
-        assert where_predicate in ("AND", "OR")
+        if where_predicate not in _VALID_PREDICATES:
+            msg = "where_predicate must be 'AND' or 'OR'"
+            raise ValueError(msg)
 
         self._where_cond_root = WhereCondition(self, where_predicate=where_predicate)
 
-        # Default first condition is 'AND'; will be ignored if where_or is called first
-        self.where_cond(where_predicate="AND")
+        # The condition builder methods append to; tracked directly so each
+        # append skips re-indexing the root's condition list. The default
+        # first 'AND' condition is created lazily so statements that never
+        # use WHERE skip the allocation.
+        self._active_cond: WhereCondition | None = None
 
     def where_value(
         self,
@@ -153,7 +162,7 @@ class WhereMixin:
             >>> q.from_table('t1').where_value('DATE(`t1c1`)', datetime.date(2014,3,2), '>').sql()
             ('SELECT * FROM t1 WHERE DATE(`t1c1`) > ?', ['2014-03-02'])
         """
-        self.get_where_cond().where_value(field_or_dict, value, operator)
+        self._get_active_cond().where_value(field_or_dict, value, operator)
         return self
 
     where_values = where_value
@@ -209,7 +218,7 @@ class WhereMixin:
             >>> q.from_table('t1').where_raw_value('DATE(`t1c1`)', 'NOW()', '>').sql()
             ('SELECT * FROM t1 WHERE DATE(`t1c1`) > NOW()')
         """
-        self.get_where_cond().where_raw_value(field_or_dict, raw_value, operator, value_params)
+        self._get_active_cond().where_raw_value(field_or_dict, raw_value, operator, value_params)
         return self
 
     where_raw_values = where_raw_value
@@ -246,11 +255,24 @@ class WhereMixin:
             >>> q.from_table('t1').where_expr('`t1c1` = PASSWORD(?)', ('mypw',)).sql()
             ('SELECT * FROM t1 WHERE `t1c1` = PASSWORD(?)', ['mypw'])
         """
-        self.get_where_cond().where_expr(list_or_expr, expr_params)
+        self._get_active_cond().where_expr(list_or_expr, expr_params)
         return self
 
     where_exprs = where_expr
 
+    def _get_active_cond(self) -> WhereCondition:
+        """Return the condition that builder methods append to.
+
+        Creates the default first 'AND' condition on first use; a prior
+        ``where_and`` or ``where_or`` will have set the active condition already.
+        """
+        cond = self._active_cond
+        if cond is None:
+            self.where_cond(where_predicate="AND")
+            cond = self._active_cond
+            assert cond is not None
+        return cond
+
     def get_where_cond(self, index: int = -1) -> WhereCondition:
         """Returns a ``WhereCondition`` object from the list of conditions.
 
@@ -267,6 +289,11 @@ class WhereMixin:
         See Also:
             :py:class:`mysqlstmt.where_condition.WhereCondition` :py:meth:`where_cond`
         """
+        if index == -1:
+            return self._get_active_cond()
+        # Materialize the lazily created default condition so positional
+        # access sees the same list the builder methods append to.
+        self._get_active_cond()
         return self._where_cond_root.get_where_cond(index)
 
     def where_cond(self, cond: WhereCondition | None = None, where_predicate: WherePredT | None = None) -> Self:
@@ -287,6 +314,7 @@ class WhereMixin:
             :py:class:`mysqlstmt.where_condition.WhereCondition` :py:meth:`where_and` :py:meth:`where_or`
         """
         self._where_cond_root.add_cond(cond, where_predicate)
+        self._active_cond = self._where_cond_root.get_where_cond()
         return self
 
     def where_and(self) -> Self:
@@ -315,7 +343,13 @@ class WhereMixin:
                 .where_value('t1c2', 5).where_and().where_value('t1c1', 6).where_value('t1c2', 10).sql()
             ('SELECT * FROM t1 WHERE ((`t1c1` = 1 AND `t1c2` = 5) OR (`t1c1` = 6 AND `t1c2` = 10))', None)
         """
+        cond = self._active_cond
+        if cond is not None and cond.is_empty and cond.predicate == "AND":
+            # Nothing was added to the current 'AND' condition; reuse it.
+            return self
+
         self._where_cond_root.where_and()
+        self._active_cond = self._where_cond_root.get_where_cond()
         return self
 
     def where_or(self) -> Self:
@@ -331,12 +365,18 @@ class WhereMixin:
 
             >>> q = Select()
             >>> q.from_table('t1').where_or().where_value('t1c1', 3).where_value('t1c1', 5).sql()
-            ('SELECT * FROM t1 WHERE (`t1c1` = 3 OR `t1c1` = 5)', None)
+            ('SELECT * FROM t1 WHERE `t1c1` IN (3, 5)', None)
 
             >>> q = Select(where_predicate='AND')
             >>> q.from_table('t1').where_or().where_value('t1c1', 1).where_value(
                 't1c1', 5).where_or().where_value('t1c1', 6).where_value('t1c1', 10).sql()
-            ('SELECT * FROM t1 WHERE ((`t1c1` = 1 OR `t1c1` = 5) AND (`t1c1` = 6 OR `t1c1` = 10))', None)
+            ('SELECT * FROM t1 WHERE (`t1c1` IN (1, 5) AND `t1c1` IN (6, 10))', None)
         """
+        cond = self._active_cond
+        if cond is not None and cond.is_empty and cond.predicate == "OR":
+            # Nothing was added to the current 'OR' condition; reuse it.
+            return self
+
         self._where_cond_root.where_or()
+        self._active_cond = self._where_cond_root.get_where_cond()
         return self
@@ -0,0 +1,21 @@
+import pytest
+
+from mysqlstmt import Select
+
+
+@pytest.fixture(scope="session")
+def t1_select() -> Select:
+    """Shared ``SELECT t1c1 FROM t1`` builder; tests only read its ``sql()``."""
+    return Select("t1").column("t1c1")
+
+
+@pytest.fixture(scope="session")
+def t2_select() -> Select:
+    """Shared ``SELECT t2c1 FROM t2`` builder; tests only read its ``sql()``."""
+    return Select("t2").column("t2c1")
+
+
+@pytest.fixture(scope="session")
+def bare_select() -> Select:
+    """Shared parent statement for conditions built directly from WhereCondition."""
+    return Select()
@@ -1,8 +1,6 @@
-from collections import OrderedDict
-
 import pytest
 
-from mysqlstmt import Insert, Select
+from mysqlstmt import Config, Insert, Select
 
 
 class TestInsert:
@@ -34,19 +32,19 @@ class TestInsert:
 
     def test_dict_ints(self) -> None:
         q = Insert()
-        values = {**OrderedDict([("t1c1", 1), ("t1c2", 2)])}
+        values = {"t1c1": 1, "t1c2": 2}
         sql_t = q.into_table("t1").set_value(values).sql()
         assert sql_t == ("INSERT INTO t1 (`t1c1`, `t1c2`) VALUES (1, 2)", None)
 
     def test_dict_strings(self) -> None:
         q = Insert()
-        values = {**OrderedDict([("t1c1", "a"), ("t1c2", "b")])}
+        values = {"t1c1": "a", "t1c2": "b"}
         sql_t = q.into_table("t1").set_value(values).sql()
         assert sql_t == ("INSERT INTO t1 (`t1c1`, `t1c2`) VALUES (?, ?)", ["a", "b"])
 
     def test_null(self) -> None:
         q = Insert()
-        values = {**OrderedDict([("t1c1", "a"), ("t1c2", None)])}
+        values = {"t1c1": "a", "t1c2": None}
         sql_t = q.into_table("t1").set_value(values).sql()
         assert sql_t == ("INSERT INTO t1 (`t1c1`, `t1c2`) VALUES (?, NULL)", ["a"])
 
@@ -134,7 +132,7 @@ class TestInsert:
 
     def test_dict_strings_utf_param(self) -> None:
         q = Insert()
-        values = {**OrderedDict([("t1c1", "äöü")])}
+        values = {"t1c1": "äöü"}
         sql_t = q.into_table("t1").set_value(values).sql()
         assert sql_t == ("INSERT INTO t1 (`t1c1`) VALUES (?)", ["äöü"])
 
@@ -211,3 +209,19 @@ class TestInsert:
         qselect = Select("t2").columns(["t2c1"]).where_value("t2c1", "t2v1")
         with pytest.raises(ValueError):  # noqa: PT011
             q.into_table("t1").columns(["t1c1"]).select(qselect).sql()
+
+    def test_compile_template(self) -> None:
+        render = Insert.compile_template("t1", ("t1c1", "t1c2"))
+        assert render((1, 2)) == ("INSERT INTO t1 (`t1c1`, `t1c2`) VALUES (?, ?)", [1, 2])
+
+    def test_compile_template_ignore(self) -> None:
+        render = Insert.compile_template("t1", ("t1c1",), ignore_error=True)
+        assert render(("a",)) == ("INSERT IGNORE INTO t1 (`t1c1`) VALUES (?)", ["a"])
+
+    def test_compile_template_noparam(self) -> None:
+        Config.placeholder = False  # pyright: ignore[reportAttributeAccessIssue]
+        try:
+            with pytest.raises(ValueError, match="placeholder"):
+                Insert.compile_template("t1", ("t1c1",))
+        finally:
+            Config.placeholder = "?"
@@ -1,560 +1,564 @@
 import datetime
-from collections import OrderedDict
 
 import pytest
 
 from mysqlstmt import Select
 
+UTC = datetime.timezone.utc
+
+# Immutable temporal inputs shared by the case tables, built once at import.
+DATE_2014_03_02 = datetime.date(2014, 3, 2)
+DATE_2014_03_12 = datetime.date(2014, 3, 12)
+TIME_12_01_02 = datetime.time(12, 1, 2)
+DATETIME_2014_03_02_UTC = datetime.datetime(2014, 3, 2, 12, 1, 2, tzinfo=UTC)
+
+# Column tuples shared across the join cases, allocated once at import.
+COLS_12 = ("t1c1", "t2c1")
+COLS_123 = ("t1c1", "t2c1", "t3c1")
+
+
+class _StrObj:
+    """A non-SQL value that is pickled through ``str()``."""
+
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return "object as a string"
+
+
+# Families of structurally identical checks are parametrized below so each
+# case is one row, not one method.
+
+WHERE_VALUE_CASES = [
+    ("t1c1", 3, "=", ("SELECT * FROM t1 WHERE `t1c1` = 3", None)),
+    ("t1c1", True, "=", ("SELECT * FROM t1 WHERE `t1c1` = 1", None)),
+    ("t1c1", False, "=", ("SELECT * FROM t1 WHERE `t1c1` = 0", None)),
+    (
+        "t1c1",
+        DATETIME_2014_03_02_UTC,
+        "=",
+        ("SELECT * FROM t1 WHERE `t1c1` = ?", ["2014-03-02 12:01:02"]),
+    ),
+    ("t1c1", DATE_2014_03_02, "=", ("SELECT * FROM t1 WHERE `t1c1` = ?", ["2014-03-02"])),
+    ("t1c1", TIME_12_01_02, "=", ("SELECT * FROM t1 WHERE `t1c1` = ?", ["12:01:02"])),
+    ("t1c1", datetime.time(12, 1, 2, tzinfo=UTC), "=", ("SELECT * FROM t1 WHERE `t1c1` = ?", ["12:01:02"])),
+    ("DATE(`t1c1`)", DATE_2014_03_02, ">", ("SELECT * FROM t1 WHERE DATE(`t1c1`) > ?", ["2014-03-02"])),
+    ("t1c1", None, "=", ("SELECT * FROM t1 WHERE `t1c1` IS NULL", None)),
+    ("t1c1", None, "<>", ("SELECT * FROM t1 WHERE `t1c1` IS NOT NULL", None)),
+    ("t1c1", [1, 2, 3], "=", ("SELECT * FROM t1 WHERE `t1c1` IN (1, 2, 3)", None)),
+    ("t1c1", [1, 2, 3], "<>", ("SELECT * FROM t1 WHERE `t1c1` NOT IN (1, 2, 3)", None)),
+    ("t1c1", [1], "=", ("SELECT * FROM t1 WHERE `t1c1` = 1", None)),
+    ("t1c1", [1], "<>", ("SELECT * FROM t1 WHERE `t1c1` <> 1", None)),
+    ("t1c1", [1], "IN", ("SELECT * FROM t1 WHERE `t1c1` = 1", None)),
+    ("t1c1", [1], "NOT IN", ("SELECT * FROM t1 WHERE `t1c1` <> 1", None)),
+    ("t1c1", [], "=", ("SELECT * FROM t1 WHERE 0", None)),
+    ("t1c1", "abc%", "LIKE", ("SELECT * FROM t1 WHERE `t1c1` LIKE ?", ["abc%"])),
+    ("t1c1", "abc%", "NOT LIKE", ("SELECT * FROM t1 WHERE `t1c1` NOT LIKE ?", ["abc%"])),
+    ("t1c1", "äöü", "=", ("SELECT * FROM t1 WHERE `t1c1` = ?", ["äöü"])),
+]
+
+WHERE_RAW_VALUE_CASES = [
+    ("t1c1", "NOW()", "=", None, ("SELECT * FROM t1 WHERE `t1c1` = NOW()", None)),
+    ("t1c1", "PASSWORD(?)", "=", ("mypw",), ("SELECT * FROM t1 WHERE `t1c1` = PASSWORD(?)", ["mypw"])),
+    ("DATE(t1c1)", "NOW()", ">", None, ("SELECT * FROM t1 WHERE DATE(t1c1) > NOW()", None)),
+    ("t1c1", "1 AND 5", "BETWEEN", None, ("SELECT * FROM t1 WHERE `t1c1` BETWEEN 1 AND 5", None)),
+    ("t1c1", "? AND ?", "BETWEEN", ("a", "b"), ("SELECT * FROM t1 WHERE `t1c1` BETWEEN ? AND ?", ["a", "b"])),
+    (
+        "DATE(`t1c1`)",
+        "? AND ?",
+        "BETWEEN",
+        (DATE_2014_03_02, DATE_2014_03_12),
+        ("SELECT * FROM t1 WHERE DATE(`t1c1`) BETWEEN ? AND ?", ["2014-03-02", "2014-03-12"]),
+    ),
+]
+
+WHERE_EXPR_CASES = [
+    ("`t1c1` = NOW()", None, ("SELECT * FROM t1 WHERE `t1c1` = NOW()", None)),
+    (["`t1c1` = NOW()", "`t1c2` = NOW()"], None, ("SELECT * FROM t1 WHERE (`t1c1` = NOW() AND `t1c2` = NOW())", None)),
+    ("`t1c1` = PASSWORD(?)", ("mypw",), ("SELECT * FROM t1 WHERE `t1c1` = PASSWORD(?)", ["mypw"])),
+    ('`t1c1` = "äöü"', None, ('SELECT * FROM t1 WHERE `t1c1` = "äöü"', None)),
+]
+
+HAVING_VALUE_CASES = [
+    ("t1c1", 3, "=", ("SELECT * FROM t1 HAVING `t1c1` = 3", None)),
+]
+
+HAVING_RAW_VALUE_CASES = [
+    ("t1c1", "NOW()", "=", None, ("SELECT * FROM t1 HAVING `t1c1` = NOW()", None)),
+    ("t1c1", "PASSWORD(?)", "=", ("mypw",), ("SELECT * FROM t1 HAVING `t1c1` = PASSWORD(?)", ["mypw"])),
+]
+
+HAVING_EXPR_CASES = [
+    ("`t1c1` = NOW()", None, ("SELECT * FROM t1 HAVING `t1c1` = NOW()", None)),
+    ("`t1c1` = PASSWORD(?)", ("mypw",), ("SELECT * FROM t1 HAVING `t1c1` = PASSWORD(?)", ["mypw"])),
+]
+
+# Each row is columns, from table, join table, join condition, join type and the expected SQL.
+JOIN_CASES = [
+    # > join(table, 'Field1')
+    # > JOIN table USING (Field1)
+    (
+        COLS_12,
+        "t1",
+        "t2",
+        "t1c1",
+        "LEFT",
+        ("SELECT `t1c1`, `t2c1` FROM t1 LEFT JOIN t2 USING (`t1c1`)", None),
+    ),
+    # > join(table, '.Field1')
+    # > JOIN table ON (root_table.Field1 = table.Field1)
+    (
+        COLS_12,
+        "t1",
+        "t2",
+        ".t1c1",
+        "LEFT",
+        ("SELECT `t1c1`, `t2c1` FROM t1 LEFT JOIN t2 ON (t1.`t1c1` = t2.`t1c1`)", None),
+    ),
+    # > when join_cond is ('Field1', 'Field2', ...)
+    # > JOIN table USING (Field1, Field2, ...)
+    (
+        COLS_12,
+        "t1",
+        "t2",
+        ("t1c1", "t2c1"),
+        "LEFT",
+        ("SELECT `t1c1`, `t2c1` FROM t1 LEFT JOIN t2 USING (`t1c1`, `t2c1`)", None),
+    ),
+    # > join(table, (.Field1, .Field2))
+    # > JOIN table ON (root_table.Field1 = table.Field2)
+    (
+        COLS_12,
+        "t1",
+        "t2",
+        (".t1c1", ".t2c1"),
+        "LEFT",
+        ("SELECT `t1c1`, `t2c1` FROM t1 LEFT JOIN t2 ON (t1.`t1c1` = t2.`t2c1`)", None),
+    ),
+    # > join(table, [condition,...])
+    # > JOIN table ON (condition [AND condition [AND ...]])
+    (
+        COLS_12,
+        "t1",
+        "t2",
+        ["t1c1 = t2c1"],
+        "LEFT",
+        ("SELECT `t1c1`, `t2c1` FROM t1 LEFT JOIN t2 ON (t1c1 = t2c1)", None),
+    ),
+    (
+        ["t1.t1c1", "t2.t2c1"],
+        "t1",
+        "t2",
+        (".t1c1", ".t2c1"),
+        "LEFT",
+        ("SELECT t1.`t1c1`, t2.`t2c1` FROM t1 LEFT JOIN t2 ON (t1.`t1c1` = t2.`t2c1`)", None),
+    ),
+    (
+        COLS_12,
+        "t1",
+        "t2",
+        "t1c1",
+        "STRAIGHT_JOIN",
+        ("SELECT `t1c1`, `t2c1` FROM t1 STRAIGHT_JOIN t2 USING (`t1c1`)", None),
+    ),
+    (
+        ["t1a.c1", "t2a.c1"],
+        "t1 AS t1a",
+        "t2 AS t2a",
+        (".t1c1", ".t2c1"),
+        "LEFT",
+        ("SELECT t1a.`c1`, t2a.`c1` FROM t1 AS t1a LEFT JOIN t2 AS t2a ON (t1a.`t1c1` = t2a.`t2c1`)", None),
+    ),
+    (
+        ["t1a.c1", "t2a.c1"],
+        "t1 AS t1a",
+        "t2 AS t2a",
+        ".t1c1",
+        "LEFT",
+        ("SELECT t1a.`c1`, t2a.`c1` FROM t1 AS t1a LEFT JOIN t2 AS t2a ON (t1a.`t1c1` = t2a.`t1c1`)", None),
+    ),
+]
+
+
+@pytest.fixture
+def t1() -> Select:
+    """Fresh single-table builder; most cases only vary the conditions."""
+    return Select().from_table("t1")
+
+
+def test_constructor_table_name() -> None:
+    q = Select("t1")
+    sql_t = q.columns("t1c1").sql()
+    assert sql_t == ("SELECT `t1c1` FROM t1", None)
+
+
+def test_select_nocol(t1: Select) -> None:
+    sql_t = t1.sql()
+    assert sql_t == ("SELECT * FROM t1", None)
+
+
+def test_select_col(t1: Select) -> None:
+    sql_t = t1.columns("t1c1").sql()
+    assert sql_t == ("SELECT `t1c1` FROM t1", None)
+
+
+def test_select_col_qualified(t1: Select) -> None:
+    sql_t = t1.columns("t1.t1c1").sql()
+    assert sql_t == ("SELECT t1.`t1c1` FROM t1", None)
+
+
+def test_select_col_qualified_noquotes() -> None:
+    q = Select(quote_all_col_refs=False)
+    sql_t = q.from_table("t1").columns("t1.t1c1").sql()
+    assert sql_t == ("SELECT t1.t1c1 FROM t1", None)
+
+
+def test_select_col_tableas() -> None:
+    q = Select()
+    sql_t = q.from_table("t1 AS t1a").columns("t1c1").sql()
+    assert sql_t == ("SELECT `t1c1` FROM t1 AS t1a", None)
+
+
+def test_select_col_callable(t1: Select) -> None:
+    sql_t = t1.columns("t1c1")()
+    assert sql_t == ("SELECT `t1c1` FROM t1", None)
+
+
+def test_select_cols_fn(t1: Select) -> None:
+    sql_t = t1.column("t1c1").column("t1c2").sql()
+    assert sql_t == ("SELECT `t1c1`, `t1c2` FROM t1", None)
+
 
-class TestSelect:
-    def test_constructor_table_name(self) -> None:
-        q = Select("t1")
-        sql_t = q.columns("t1c1").sql()
-        assert sql_t == ("SELECT `t1c1` FROM t1", None)
-
-    def test_select_nocol(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").sql()
-        assert sql_t == ("SELECT * FROM t1", None)
-
-    def test_select_col(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").columns("t1c1").sql()
-        assert sql_t == ("SELECT `t1c1` FROM t1", None)
-
-    def test_select_col_qualified(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").columns("t1.t1c1").sql()
-        assert sql_t == ("SELECT t1.`t1c1` FROM t1", None)
-
-    def test_select_col_qualified_noquotes(self) -> None:
-        q = Select(quote_all_col_refs=False)
-        sql_t = q.from_table("t1").columns("t1.t1c1").sql()
-        assert sql_t == ("SELECT t1.t1c1 FROM t1", None)
-
-    def test_select_col_tableas(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1 AS t1a").columns("t1c1").sql()
-        assert sql_t == ("SELECT `t1c1` FROM t1 AS t1a", None)
-
-    def test_select_col_callable(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").columns("t1c1")()
-        assert sql_t == ("SELECT `t1c1` FROM t1", None)
-
-    def test_select_cols_fn(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").column("t1c1").column("t1c2").sql()
-        assert sql_t == ("SELECT `t1c1`, `t1c2` FROM t1", None)
-
-    def test_select_cols_list(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").columns(["t1c1", "t1c2"]).sql()
-        assert sql_t == ("SELECT `t1c1`, `t1c2` FROM t1", None)
-
-    def test_select_cols_tuple(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").columns(("t1c1", "t1c2")).sql()
-        assert sql_t == ("SELECT `t1c1`, `t1c2` FROM t1", None)
-
-    def test_select_no_table(self) -> None:
-        q = Select()
-        sql_t = q.column_expr("1+1").sql()
-        assert sql_t == ("SELECT 1+1", None)
-
-    def test_select_expr_with_param(self) -> None:
-        q = Select()
-        data = ["mypw"]
-        sql_t = q.column_expr("PASSWORD(?)", data).sql()
-        assert sql_t == ("SELECT PASSWORD(?)", data)
-
-    def test_select_distinct(self) -> None:
-        q = Select("t1")
-        sql_t = q.set_option("DISTINCT").columns("t1c1").sql()
-        assert sql_t == ("SELECT DISTINCT `t1c1` FROM t1", None)
-
-    def test_select_quote_col_prequoted(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").columns("`t1c1`").sql()
-        assert sql_t == ("SELECT `t1c1` FROM t1", None)
-
-    def test_select_quote_col_func(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").columns("DATE(`t1c1`)").sql()
-        assert sql_t == ("SELECT DATE(`t1c1`) FROM t1", None)
-
-    def test_select_quote_col_as(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").columns("t1c1 AS t1a1").sql()
-        assert sql_t == ("SELECT t1c1 AS t1a1 FROM t1", None)
-
-    def test_join_field(self) -> None:
-        # > join(table, 'Field1')
-        # > JOIN table USING (Field1)
-        q = Select()
-        sql_t = q.columns(["t1c1", "t2c1"]).from_table("t1").left_join("t2", "t1c1").sql()
-        assert sql_t == ("SELECT `t1c1`, `t2c1` FROM t1 LEFT JOIN t2 USING (`t1c1`)", None)
-
-    def test_join_root_field(self) -> None:
-        # > join(table, '.Field1')
-        # > JOIN table ON (root_table.Field1 = table.Field1)
-        q = Select()
-        sql_t = q.columns(["t1c1", "t2c1"]).from_table("t1").left_join("t2", ".t1c1").sql()
-        assert sql_t == ("SELECT `t1c1`, `t2c1` FROM t1 LEFT JOIN t2 ON (t1.`t1c1` = t2.`t1c1`)", None)
-
-    def test_join_field_list(self) -> None:
-        # > when join_cond is ('Field1', 'Field2', ...)
-        # > JOIN table USING (Field1, Field2, ...)
-        q = Select()
-        sql_t = q.columns(["t1c1", "t2c1"]).from_table("t1").left_join("t2", ("t1c1", "t2c1")).sql()
-        assert sql_t == ("SELECT `t1c1`, `t2c1` FROM t1 LEFT JOIN t2 USING (`t1c1`, `t2c1`)", None)
-
-    def test_join_fields(self) -> None:
-        # > join(table, (.Field1, .Field2))
-        # > JOIN table ON (root_table.Field1 = table.Field2)
-        q = Select()
-        sql_t = q.columns(["t1c1", "t2c1"]).from_table("t1").left_join("t2", (".t1c1", ".t2c1")).sql()
-        assert sql_t == ("SELECT `t1c1`, `t2c1` FROM t1 LEFT JOIN t2 ON (t1.`t1c1` = t2.`t2c1`)", None)
-
-    def test_join_condition(self) -> None:
-        # > join(table, [condition,...])
-        # > JOIN table ON (condition [AND condition [AND ...]])
-        q = Select()
-        sql_t = q.columns(["t1c1", "t2c1"]).from_table("t1").left_join("t2", ["t1c1 = t2c1"]).sql()
-        assert sql_t == ("SELECT `t1c1`, `t2c1` FROM t1 LEFT JOIN t2 ON (t1c1 = t2c1)", None)
-
-    def test_join_conditions(self) -> None:
-        # > join(table, [condition,...])
-        # > JOIN table ON (condition [AND condition [AND ...]])
-        q = Select()
-        sql_t = q.columns(["t1c1", "t2c1"]).from_table("t1").left_join("t2", ["t1c1 = t2c1"]).sql()
-        assert sql_t == ("SELECT `t1c1`, `t2c1` FROM t1 LEFT JOIN t2 ON (t1c1 = t2c1)", None)
-
-    def test_join_fields_qualified(self) -> None:
-        # > join(table, (.Field1, .Field2))
-        # > JOIN table ON (root_table.Field1 = table.Field2)
-        q = Select()
-        sql_t = q.columns(["t1.t1c1", "t2.t2c1"]).from_table("t1").left_join("t2", (".t1c1", ".t2c1")).sql()
-        assert sql_t == ("SELECT t1.`t1c1`, t2.`t2c1` FROM t1 LEFT JOIN t2 ON (t1.`t1c1` = t2.`t2c1`)", None)
-
-    def test_straight_join_field(self) -> None:
-        # > join(table, 'Field1')
-        # > JOIN table USING (Field1)
-        q = Select()
-        sql_t = q.columns(["t1c1", "t2c1"]).from_table("t1").join("t2", "t1c1", "STRAIGHT_JOIN").sql()
-        assert sql_t == ("SELECT `t1c1`, `t2c1` FROM t1 STRAIGHT_JOIN t2 USING (`t1c1`)", None)
-
-    def test_join_fields_tableas(self) -> None:
-        # > join(table, (.Field1, .Field2))
-        # > JOIN table ON (root_table.Field1 = table.Field2)
-        q = Select()
-        sql_t = q.columns(["t1a.c1", "t2a.c1"]).from_table("t1 AS t1a").left_join("t2 AS t2a", (".t1c1", ".t2c1")).sql()
-        assert sql_t == ("SELECT t1a.`c1`, t2a.`c1` FROM t1 AS t1a LEFT JOIN t2 AS t2a ON (t1a.`t1c1` = t2a.`t2c1`)", None)
-
-    def test_join_root_field_tableas(self) -> None:
-        # > join(table, '.Field1')
-        # > JOIN table ON (root_table.Field1 = table.Field1)
-        q = Select()
-        sql_t = q.columns(["t1a.c1", "t2a.c1"]).from_table("t1 AS t1a").left_join("t2 AS t2a", ".t1c1").sql()
-        assert sql_t == ("SELECT t1a.`c1`, t2a.`c1` FROM t1 AS t1a LEFT JOIN t2 AS t2a ON (t1a.`t1c1` = t2a.`t1c1`)", None)
-
-    def test_join_root_field_multi(self) -> None:
-        # > join(table, '.Field1')
-        # > JOIN table ON (root_table.Field1 = table.Field1)
-        q = Select()
-        sql_t = q.columns(["t1c1", "t2c1", "t3c1"]).from_table("t1").left_join("t2", ".t1c1").left_join("t3", ".t1c1").sql()
-        assert sql_t == (
-            "SELECT `t1c1`, `t2c1`, `t3c1` FROM t1 LEFT JOIN t2 ON (t1.`t1c1` = t2.`t1c1`) LEFT JOIN t3 ON (t1.`t1c1` = t3.`t1c1`)",
-            None,
-        )
-
-    def test_join_root_field_multi_dict(self) -> None:
-        # > join(table, '.Field1')
-        # > JOIN table ON (root_table.Field1 = table.Field1)
-        q = Select()
-        sql_t = q.columns(["t1c1", "t2c1", "t3c1"]).from_table("t1").left_join(OrderedDict([("t2", ".t1c1"), ("t3", ".t1c1")])).sql()
-        assert sql_t == (
-            "SELECT `t1c1`, `t2c1`, `t3c1` FROM t1 LEFT JOIN t2 ON (t1.`t1c1` = t2.`t1c1`) LEFT JOIN t3 ON (t1.`t1c1` = t3.`t1c1`)",
-            None,
-        )
-
-    def test_join_root_field_multi_dotdot(self) -> None:
-        # > join(table, '..Field1')
-        # > JOIN table ON (previous_join_table.Field1 = table.Field1)
-        q = Select()
-        sql_t = q.columns(["t1c1", "t2c1", "t3c1"]).from_table("t1").left_join("t2", "..t1c1").left_join("t3", "..t2c1").sql()
-        assert sql_t == (
-            "SELECT `t1c1`, `t2c1`, `t3c1` FROM t1 LEFT JOIN t2 ON (t1.`t1c1` = t2.`t1c1`) LEFT JOIN t3 ON (t2.`t2c1` = t3.`t2c1`)",
-            None,
-        )
-
-    def test_where_value(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", 3).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = 3", None)
-
-    def test_where_values(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", 3).where_value("t1c2", "string").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` = 3 AND `t1c2` = ?)", ["string"])
-
-    def test_where_value_or(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_or().where_value("t1c1", 3).where_value("t1c1", 5).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` = 3 OR `t1c1` = 5)", None)
-
-    def test_where_value_and_or_default(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", 1).where_value("t1c2", 5).where_and().where_value("t1c1", 6).where_value("t1c2", 10).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE ((`t1c1` = 1 AND `t1c2` = 5) OR (`t1c1` = 6 AND `t1c2` = 10))", None)
-
-    def test_where_value_and_or(self) -> None:
-        q = Select()
-        sql_t = (
-            q.from_table("t1")
-            .where_and()
-            .where_value("t1c1", 1)
-            .where_value("t1c2", 5)
-            .where_and()
-            .where_value("t1c1", 6)
-            .where_value("t1c2", 10)
-            .sql()
-        )
-        assert sql_t == ("SELECT * FROM t1 WHERE ((`t1c1` = 1 AND `t1c2` = 5) OR (`t1c1` = 6 AND `t1c2` = 10))", None)
-
-    def test_where_value_or_and(self) -> None:
-        q = Select(where_predicate="AND")
-        sql_t = (
-            q.from_table("t1")
-            .where_or()
-            .where_value("t1c1", 1)
-            .where_value("t1c1", 5)
-            .where_or()
-            .where_value("t1c1", 6)
-            .where_value("t1c1", 10)
-            .sql()
-        )
-        assert sql_t == ("SELECT * FROM t1 WHERE ((`t1c1` = 1 OR `t1c1` = 5) AND (`t1c1` = 6 OR `t1c1` = 10))", None)
-
-    def test_where_values_dict(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value(OrderedDict([("t1c1", 3), ("t1c2", "string")])).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` = 3 AND `t1c2` = ?)", ["string"])
-
-    def test_where_values_noparam(self) -> None:
-        q = Select(placeholder=False)
-        sql = q.from_table("t1").where_value("t1c1", 3).where_value("t1c2", "'string'").sql()
-        assert sql == "SELECT * FROM t1 WHERE (`t1c1` = 3 AND `t1c2` = 'string')"
-
-    def test_where_raw_value(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_raw_value("t1c1", "NOW()").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = NOW()", None)
-
-    def test_where_raw_values(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_raw_value(OrderedDict([("t1c1", "NOW()"), ("t1c2", "NOW()")])).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` = NOW() AND `t1c2` = NOW())", None)
-
-    def test_where_raw_value_with_param(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_raw_value("t1c1", "PASSWORD(?)", value_params=("mypw",)).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = PASSWORD(?)", ["mypw"])
-
-    def test_where_raw_values_with_param(self) -> None:
-        q = Select()
-        sql_t = (
-            q.from_table("t1")
-            .where_raw_value("t1c1", "PASSWORD(?)", value_params=("mypw1",))
-            .where_raw_value("t1c2", "PASSWORD(?)", value_params=("mypw2",))
-            .sql()
-        )
-        assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` = PASSWORD(?) AND `t1c2` = PASSWORD(?))", ["mypw1", "mypw2"])
-
-    def test_where_raw_value_with_param_between(self) -> None:
-        between_dates = (datetime.date(2014, 3, 2), datetime.date(2014, 3, 12))
-        q = Select()
-        sql_t = q.from_table("t1").where_raw_value("DATE(`t1c1`)", "? AND ?", "BETWEEN", between_dates).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE DATE(`t1c1`) BETWEEN ? AND ?", ["2014-03-02", "2014-03-12"])
-
-    def test_where_raw_value_func(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_raw_value("DATE(t1c1)", "NOW()", ">").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE DATE(t1c1) > NOW()", None)
-
-    def test_where_value_true(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", True).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = 1", None)
-
-    def test_where_value_false(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", False).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = 0", None)
-
-    def test_where_value_datetime(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", datetime.datetime(2014, 3, 2, 12, 1, 2, tzinfo=datetime.timezone.utc)).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = ?", ["2014-03-02 12:01:02"])
-
-    def test_where_value_date(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", datetime.date(2014, 3, 2)).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = ?", ["2014-03-02"])
-
-    def test_where_value_time(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", datetime.time(12, 1, 2)).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = ?", ["12:01:02"])
-
-    def test_where_value_date_func(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("DATE(`t1c1`)", datetime.date(2014, 3, 2), ">").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE DATE(`t1c1`) > ?", ["2014-03-02"])
-
-    def test_where_value_object(self) -> None:
-        class TestClass:
-            def __str__(self) -> str:
-                return "object as a string"
-
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", TestClass()).sql()  # pyright:ignore[reportArgumentType]
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = ?", ["object as a string"])
-
-    def test_where_expr(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_expr("`t1c1` = NOW()").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = NOW()", None)
-
-    def test_where_exprs(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_expr(["`t1c1` = NOW()", "`t1c2` = NOW()"]).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` = NOW() AND `t1c2` = NOW())", None)
-
-    def test_where_expr_with_expr_param(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_expr("`t1c1` = PASSWORD(?)", ("mypw",)).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = PASSWORD(?)", ["mypw"])
-
-    def test_where_value_null(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", None).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` IS NULL", None)
-
-    def test_where_value_notnull(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", None, "<>").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` IS NOT NULL", None)
-
-    def test_where_value_in(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", [1, 2, 3]).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` IN (1, 2, 3)", None)
-
-    def test_where_value_notin(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", [1, 2, 3], "<>").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` NOT IN (1, 2, 3)", None)
-
-    def test_where_value_in_single(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", [1]).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = 1", None)
-
-    def test_where_value_notin_single(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", [1], "<>").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` <> 1", None)
-
-    def test_where_value_in_single_alt(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", [1], "IN").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = 1", None)
-
-    def test_where_value_notin_single_alt(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", [1], "NOT IN").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` <> 1", None)
-
-    def test_where_value_like(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", "abc%", "LIKE").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` LIKE ?", ["abc%"])
-
-    def test_where_value_notlike(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", "abc%", "NOT LIKE").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` NOT LIKE ?", ["abc%"])
-
-    def test_where_raw_value_between(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_raw_value("t1c1", "1 AND 5", "BETWEEN").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` BETWEEN 1 AND 5", None)
-
-    def test_where_raw_value_between_tuple_param(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_raw_value("t1c1", "? AND ?", "BETWEEN", value_params=("a", "b")).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` BETWEEN ? AND ?", ["a", "b"])
-
-    def test_join_using_where_expr(self) -> None:
-        q = Select()
-        sql_t = q.from_table(["t1", "t2"]).where_expr("(t1.t1c1 = t2.t2c1)").sql()
-        assert sql_t == ("SELECT * FROM t1, t2 WHERE (t1.t1c1 = t2.t2c1)", None)
-
-    def test_having_value(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").having_value("t1c1", 3).sql()
-        assert sql_t == ("SELECT * FROM t1 HAVING `t1c1` = 3", None)
-
-    def test_having_value_or(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").having_or().having_value("t1c1", 3).having_value("t1c1", 5).sql()
-        assert sql_t == ("SELECT * FROM t1 HAVING (`t1c1` = 3 OR `t1c1` = 5)", None)
-
-    def test_having_value_and_or_default(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").having_value("t1c1", 1).having_value("t1c2", 5).having_and().having_value("t1c1", 6).having_value("t1c2", 10).sql()
-        assert sql_t == ("SELECT * FROM t1 HAVING ((`t1c1` = 1 AND `t1c2` = 5) OR (`t1c1` = 6 AND `t1c2` = 10))", None)
-
-    def test_having_value_and_or(self) -> None:
-        q = Select()
-        sql_t = (
-            q.from_table("t1")
-            .having_and()
-            .having_value("t1c1", 1)
-            .having_value("t1c2", 5)
-            .having_and()
-            .having_value("t1c1", 6)
-            .having_value("t1c2", 10)
-            .sql()
-        )
-        assert sql_t == ("SELECT * FROM t1 HAVING ((`t1c1` = 1 AND `t1c2` = 5) OR (`t1c1` = 6 AND `t1c2` = 10))", None)
-
-    def test_having_value_or_and(self) -> None:
-        q = Select(having_predicate="AND")
-        sql_t = (
-            q.from_table("t1")
-            .having_or()
-            .having_value("t1c1", 1)
-            .having_value("t1c1", 5)
-            .having_or()
-            .having_value("t1c1", 6)
-            .having_value("t1c1", 10)
-            .sql()
-        )
-        assert sql_t == ("SELECT * FROM t1 HAVING ((`t1c1` = 1 OR `t1c1` = 5) AND (`t1c1` = 6 OR `t1c1` = 10))", None)
-
-    def test_having_values(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").having_value("t1c1", 3).having_value("t1c2", "string").sql()
-        assert sql_t == ("SELECT * FROM t1 HAVING (`t1c1` = 3 AND `t1c2` = ?)", ["string"])
-
-    def test_having_values_dict(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").having_value(OrderedDict([("t1c1", 3), ("t1c2", "string")])).sql()
-        assert sql_t == ("SELECT * FROM t1 HAVING (`t1c1` = 3 AND `t1c2` = ?)", ["string"])
-
-    def test_having_raw_value(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").having_raw_value("t1c1", "NOW()").sql()
-        assert sql_t == ("SELECT * FROM t1 HAVING `t1c1` = NOW()", None)
-
-    def test_having_raw_value_with_param(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").having_raw_value("t1c1", "PASSWORD(?)", value_params=("mypw",)).sql()
-        assert sql_t == ("SELECT * FROM t1 HAVING `t1c1` = PASSWORD(?)", ["mypw"])
-
-    def test_having_expr(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").having_expr("`t1c1` = NOW()").sql()
-        assert sql_t == ("SELECT * FROM t1 HAVING `t1c1` = NOW()", None)
-
-    def test_having_expr_with_expr_param(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").having_expr("`t1c1` = PASSWORD(?)", ("mypw",)).sql()
-        assert sql_t == ("SELECT * FROM t1 HAVING `t1c1` = PASSWORD(?)", ["mypw"])
-
-    def test_select_orderby(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").order_by("t1c1").sql()
-        assert sql_t == ("SELECT * FROM t1 ORDER BY t1c1", None)
-
-    def test_select_groupby(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").group_by("t1c1").sql()
-        assert sql_t == ("SELECT * FROM t1 GROUP BY t1c1", None)
-
-    def test_select_groupbys(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").group_by(["t1c1", "t1c2"]).sql()
-        assert sql_t == ("SELECT * FROM t1 GROUP BY t1c1, t1c2", None)
-
-    def test_select_limit(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").limit(5).sql()
-        assert sql_t == ("SELECT * FROM t1 LIMIT 5", None)
-
-    def test_select_limit_offset(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").limit(10, 5).sql()
-        assert sql_t == ("SELECT * FROM t1 LIMIT 5,10", None)
-
-    def test_where_and_multi(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", 1).where_and().where_value("t1c2", 5).where_and().where_value("t1c1", 6).sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` = 1 OR `t1c2` = 5 OR `t1c1` = 6)", None)
-
-    def test_cacheable(self) -> None:
-        q = Select(cacheable=True)
-        sql_t = q.from_table("t1").columns("t1c1").sql()
-        assert sql_t == ("SELECT SQL_CACHE `t1c1` FROM t1", None)
-
-    def test_not_cacheable(self) -> None:
-        q = Select(cacheable=False)
-        sql_t = q.from_table("t1").columns("t1c1").sql()
-        assert sql_t == ("SELECT SQL_NO_CACHE `t1c1` FROM t1", None)
-
-    def test_where_value_utf_param(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_value("t1c1", "äöü").sql()
-        assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = ?", ["äöü"])
-
-    def test_where_value_utf_inline(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").where_expr('`t1c1` = "äöü"').sql()
-        assert sql_t == ('SELECT * FROM t1 WHERE `t1c1` = "äöü"', None)
-
-    def test_where_value_utf_noparam(self) -> None:
-        q = Select(placeholder=False)
-        sql = q.from_table("t1").where_value("t1c1", '"äöü"').sql()
-        assert sql == 'SELECT * FROM t1 WHERE `t1c1` = "äöü"'
-
-    def test_remove_col(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").columns(("t1c1", "t2c1")).remove_column("t2c1").sql()
-        assert sql_t == ("SELECT `t1c1` FROM t1", None)
-
-    def test_remove_col_expr(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").columns("t1c1").column_expr("1+1 AS t2c1").remove_column("t2c1").sql()
-        assert sql_t == ("SELECT `t1c1` FROM t1", None)
-
-    def test_qualify_columns(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").columns(("t1c1", "t1c2")).qualify_columns("t1", ("t1c1",)).sql()
-        assert sql_t == ("SELECT t1.`t1c1`, `t1c2` FROM t1", None)
-
-    def test_qualify_columns_all(self) -> None:
-        q = Select()
-        sql_t = q.from_table("t1").columns(("t1c1", "t1c2")).qualify_columns("t1").sql()
-        assert sql_t == ("SELECT t1.`t1c1`, t1.`t1c2` FROM t1", None)
-
-    def test_qualify_columns_all_nonqual(self) -> None:
-        q = Select()
-        sql_t = q.from_table(("t1", "t2")).columns(("t1c1", "t2.t2c1")).qualify_columns("t1").sql()
-        assert sql_t == ("SELECT t1.`t1c1`, t2.`t2c1` FROM t1, t2", None)
-
-    def test_join_no_root(self) -> None:
-        q = Select()
-        with pytest.raises(ValueError):  # noqa: PT011
-            q.columns(["t1c1", "t2c1"]).left_join("t2", "t1c1").sql()
+def test_select_cols_list(t1: Select) -> None:
+    sql_t = t1.columns(["t1c1", "t1c2"]).sql()
+    assert sql_t == ("SELECT `t1c1`, `t1c2` FROM t1", None)
+
+
+def test_select_cols_tuple(t1: Select) -> None:
+    sql_t = t1.columns(("t1c1", "t1c2")).sql()
+    assert sql_t == ("SELECT `t1c1`, `t1c2` FROM t1", None)
+
+
+def test_select_no_table() -> None:
+    q = Select()
+    sql_t = q.column_expr("1+1").sql()
+    assert sql_t == ("SELECT 1+1", None)
+
+
+def test_select_expr_with_param() -> None:
+    q = Select()
+    data = ["mypw"]
+    sql_t = q.column_expr("PASSWORD(?)", data).sql()
+    assert sql_t == ("SELECT PASSWORD(?)", data)
+
+
+def test_select_distinct() -> None:
+    q = Select("t1")
+    sql_t = q.set_option("DISTINCT").columns("t1c1").sql()
+    assert sql_t == ("SELECT DISTINCT `t1c1` FROM t1", None)
+
+
+def test_select_quote_col_prequoted(t1: Select) -> None:
+    sql_t = t1.columns("`t1c1`").sql()
+    assert sql_t == ("SELECT `t1c1` FROM t1", None)
+
+
+def test_select_quote_col_func(t1: Select) -> None:
+    sql_t = t1.columns("DATE(`t1c1`)").sql()
+    assert sql_t == ("SELECT DATE(`t1c1`) FROM t1", None)
+
+
+def test_select_quote_col_as(t1: Select) -> None:
+    sql_t = t1.columns("t1c1 AS t1a1").sql()
+    assert sql_t == ("SELECT t1c1 AS t1a1 FROM t1", None)
+
+
+@pytest.mark.parametrize(("cols", "from_table", "join_table", "join_cond", "join_type", "expected"), JOIN_CASES)
+def test_join(cols, from_table, join_table, join_cond, join_type, expected) -> None:
+    q = Select()
+    sql_t = q.columns(cols).from_table(from_table).join(join_table, join_cond, join_type)()
+    assert sql_t == expected
+
+
+def test_join_root_field_multi() -> None:
+    # > join(table, '.Field1')
+    # > JOIN table ON (root_table.Field1 = table.Field1)
+    q = Select()
+    sql_t = q.columns(COLS_123).from_table("t1").left_join("t2", ".t1c1").left_join("t3", ".t1c1").sql()
+    assert sql_t == (
+        "SELECT `t1c1`, `t2c1`, `t3c1` FROM t1 LEFT JOIN t2 ON (t1.`t1c1` = t2.`t1c1`) LEFT JOIN t3 ON (t1.`t1c1` = t3.`t1c1`)",
+        None,
+    )
+
+
+def test_join_root_field_multi_dict() -> None:
+    # > join(table, '.Field1')
+    # > JOIN table ON (root_table.Field1 = table.Field1)
+    q = Select()
+    sql_t = q.columns(COLS_123).from_table("t1").left_join({"t2": ".t1c1", "t3": ".t1c1"}).sql()
+    assert sql_t == (
+        "SELECT `t1c1`, `t2c1`, `t3c1` FROM t1 LEFT JOIN t2 ON (t1.`t1c1` = t2.`t1c1`) LEFT JOIN t3 ON (t1.`t1c1` = t3.`t1c1`)",
+        None,
+    )
+
+
+def test_join_root_field_multi_dotdot() -> None:
+    # > join(table, '..Field1')
+    # > JOIN table ON (previous_join_table.Field1 = table.Field1)
+    q = Select()
+    sql_t = q.columns(COLS_123).from_table("t1").left_join("t2", "..t1c1").left_join("t3", "..t2c1").sql()
+    assert sql_t == (
+        "SELECT `t1c1`, `t2c1`, `t3c1` FROM t1 LEFT JOIN t2 ON (t1.`t1c1` = t2.`t1c1`) LEFT JOIN t3 ON (t2.`t2c1` = t3.`t2c1`)",
+        None,
+    )
+
+
+@pytest.mark.parametrize(("field", "value", "operator", "expected"), WHERE_VALUE_CASES)
+def test_where_value(t1: Select, field, value, operator, expected) -> None:
+    sql_t = t1.where_value(field, value, operator)()
+    assert sql_t == expected
+
+
+def test_where_values(t1: Select) -> None:
+    sql_t = t1.where_value("t1c1", 3).where_value("t1c2", "string").sql()
+    assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` = 3 AND `t1c2` = ?)", ["string"])
+
+
+def test_where_value_or(t1: Select) -> None:
+    sql_t = t1.where_or().where_value("t1c1", 3).where_value("t1c1", 5).sql()
+    assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` IN (3, 5)", None)
+
+
+def test_where_value_after_sql() -> None:
+    q = Select("t1", where_predicate="AND")
+    assert q.where_value("t1c1", 1).sql() == ("SELECT * FROM t1 WHERE `t1c1` = 1", None)
+    assert q.where_value("t1c2", 2).sql() == ("SELECT * FROM t1 WHERE (`t1c1` = 1 AND `t1c2` = 2)", None)
+
+
+def test_having_value_after_sql() -> None:
+    q = Select("t1", having_predicate="AND")
+    assert q.having_value("t1c1", 1).sql() == ("SELECT * FROM t1 HAVING `t1c1` = 1", None)
+    assert q.having_value("t1c2", 2).sql() == ("SELECT * FROM t1 HAVING (`t1c1` = 1 AND `t1c2` = 2)", None)
+
+
+def test_where_value_and_or_default(t1: Select) -> None:
+    sql_t = t1.where_value("t1c1", 1).where_value("t1c2", 5).where_and().where_value("t1c1", 6).where_value("t1c2", 10).sql()
+    assert sql_t == ("SELECT * FROM t1 WHERE ((`t1c1` = 1 AND `t1c2` = 5) OR (`t1c1` = 6 AND `t1c2` = 10))", None)
+
+
+def test_where_value_and_or(t1: Select) -> None:
+    sql_t = t1.where_and().where_value("t1c1", 1).where_value("t1c2", 5).where_and().where_value("t1c1", 6).where_value("t1c2", 10).sql()
+    assert sql_t == ("SELECT * FROM t1 WHERE ((`t1c1` = 1 AND `t1c2` = 5) OR (`t1c1` = 6 AND `t1c2` = 10))", None)
+
+
+def test_where_value_or_and() -> None:
+    q = Select(where_predicate="AND")
+    sql_t = (
+        q.from_table("t1").where_or().where_value("t1c1", 1).where_value("t1c1", 5).where_or().where_value("t1c1", 6).where_value("t1c1", 10).sql()
+    )
+    assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` IN (1, 5) AND `t1c1` IN (6, 10))", None)
+
+
+def test_where_value_empty_seq_not_in(t1: Select) -> None:
+    sql_t = t1.where_value("t1c1", [], "NOT IN").where_value("t1c2", 3).sql()
+    assert sql_t == ("SELECT * FROM t1 WHERE `t1c2` = 3", None)
+
+
+def test_where_values_dict(t1: Select) -> None:
+    sql_t = t1.where_value({"t1c1": 3, "t1c2": "string"}).sql()
+    assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` = 3 AND `t1c2` = ?)", ["string"])
+
+
+def test_where_values_noparam() -> None:
+    q = Select(placeholder=False)
+    sql = q.from_table("t1").where_value("t1c1", 3).where_value("t1c2", "'string'").sql()
+    assert sql == "SELECT * FROM t1 WHERE (`t1c1` = 3 AND `t1c2` = 'string')"
+
+
+@pytest.mark.parametrize(("field", "raw_value", "operator", "value_params", "expected"), WHERE_RAW_VALUE_CASES)
+def test_where_raw_value(t1: Select, field, raw_value, operator, value_params, expected) -> None:
+    sql_t = t1.where_raw_value(field, raw_value, operator, value_params)()
+    assert sql_t == expected
+
+
+def test_where_raw_values(t1: Select) -> None:
+    sql_t = t1.where_raw_value({"t1c1": "NOW()", "t1c2": "NOW()"}).sql()
+    assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` = NOW() AND `t1c2` = NOW())", None)
+
+
+def test_where_raw_values_with_param(t1: Select) -> None:
+    sql_t = t1.where_raw_value("t1c1", "PASSWORD(?)", value_params=("mypw1",)).where_raw_value("t1c2", "PASSWORD(?)", value_params=("mypw2",)).sql()
+    assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` = PASSWORD(?) AND `t1c2` = PASSWORD(?))", ["mypw1", "mypw2"])
+
+
+def test_where_value_object() -> None:
+    q = Select()
+    sql_t = q.from_table("t1").where_value("t1c1", _StrObj()).sql()  # pyright:ignore[reportArgumentType]
+    assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = ?", ["object as a string"])
+
+
+@pytest.mark.parametrize(("expr", "expr_params", "expected"), WHERE_EXPR_CASES)
+def test_where_expr(t1: Select, expr, expr_params, expected) -> None:
+    sql_t = t1.where_expr(expr, expr_params)()
+    assert sql_t == expected
+
+
+def test_join_using_where_expr() -> None:
+    q = Select()
+    sql_t = q.from_table(["t1", "t2"]).where_expr("(t1.t1c1 = t2.t2c1)").sql()
+    assert sql_t == ("SELECT * FROM t1, t2 WHERE (t1.t1c1 = t2.t2c1)", None)
+
+
+@pytest.mark.parametrize(("field", "value", "operator", "expected"), HAVING_VALUE_CASES)
+def test_having_value(t1: Select, field, value, operator, expected) -> None:
+    sql_t = t1.having_value(field, value, operator)()
+    assert sql_t == expected
+
+
+def test_having_value_or(t1: Select) -> None:
+    sql_t = t1.having_or().having_value("t1c1", 3).having_value("t1c1", 5).sql()
+    assert sql_t == ("SELECT * FROM t1 HAVING `t1c1` IN (3, 5)", None)
+
+
+def test_having_value_and_or_default(t1: Select) -> None:
+    sql_t = t1.having_value("t1c1", 1).having_value("t1c2", 5).having_and().having_value("t1c1", 6).having_value("t1c2", 10).sql()
+    assert sql_t == ("SELECT * FROM t1 HAVING ((`t1c1` = 1 AND `t1c2` = 5) OR (`t1c1` = 6 AND `t1c2` = 10))", None)
+
+
+def test_having_value_and_or(t1: Select) -> None:
+    sql_t = t1.having_and().having_value("t1c1", 1).having_value("t1c2", 5).having_and().having_value("t1c1", 6).having_value("t1c2", 10).sql()
+    assert sql_t == ("SELECT * FROM t1 HAVING ((`t1c1` = 1 AND `t1c2` = 5) OR (`t1c1` = 6 AND `t1c2` = 10))", None)
+
+
+def test_having_value_or_and() -> None:
+    q = Select(having_predicate="AND")
+    sql_t = (
+        q.from_table("t1")
+        .having_or()
+        .having_value("t1c1", 1)
+        .having_value("t1c1", 5)
+        .having_or()
+        .having_value("t1c1", 6)
+        .having_value("t1c1", 10)
+        .sql()
+    )
+    assert sql_t == ("SELECT * FROM t1 HAVING (`t1c1` IN (1, 5) AND `t1c1` IN (6, 10))", None)
+
+
+def test_having_values(t1: Select) -> None:
+    sql_t = t1.having_value("t1c1", 3).having_value("t1c2", "string").sql()
+    assert sql_t == ("SELECT * FROM t1 HAVING (`t1c1` = 3 AND `t1c2` = ?)", ["string"])
+
+
+def test_having_values_dict(t1: Select) -> None:
+    sql_t = t1.having_value({"t1c1": 3, "t1c2": "string"}).sql()
+    assert sql_t == ("SELECT * FROM t1 HAVING (`t1c1` = 3 AND `t1c2` = ?)", ["string"])
+
+
+@pytest.mark.parametrize(("field", "raw_value", "operator", "value_params", "expected"), HAVING_RAW_VALUE_CASES)
+def test_having_raw_value(t1: Select, field, raw_value, operator, value_params, expected) -> None:
+    sql_t = t1.having_raw_value(field, raw_value, operator, value_params)()
+    assert sql_t == expected
+
+
+@pytest.mark.parametrize(("expr", "expr_params", "expected"), HAVING_EXPR_CASES)
+def test_having_expr(t1: Select, expr, expr_params, expected) -> None:
+    sql_t = t1.having_expr(expr, expr_params)()
+    assert sql_t == expected
+
+
+def test_select_orderby(t1: Select) -> None:
+    sql_t = t1.order_by("t1c1").sql()
+    assert sql_t == ("SELECT * FROM t1 ORDER BY t1c1", None)
+
+
+def test_select_groupby(t1: Select) -> None:
+    sql_t = t1.group_by("t1c1").sql()
+    assert sql_t == ("SELECT * FROM t1 GROUP BY t1c1", None)
+
+
+def test_select_groupbys(t1: Select) -> None:
+    sql_t = t1.group_by(["t1c1", "t1c2"]).sql()
+    assert sql_t == ("SELECT * FROM t1 GROUP BY t1c1, t1c2", None)
+
+
+def test_select_limit(t1: Select) -> None:
+    sql_t = t1.limit(5).sql()
+    assert sql_t == ("SELECT * FROM t1 LIMIT 5", None)
+
+
+def test_select_limit_offset(t1: Select) -> None:
+    sql_t = t1.limit(10, 5).sql()
+    assert sql_t == ("SELECT * FROM t1 LIMIT 5,10", None)
+
+
+def test_where_and_multi(t1: Select) -> None:
+    sql_t = t1.where_value("t1c1", 1).where_and().where_value("t1c2", 5).where_and().where_value("t1c1", 6).sql()
+    assert sql_t == ("SELECT * FROM t1 WHERE (`t1c1` = 1 OR `t1c2` = 5 OR `t1c1` = 6)", None)
+
+
+def test_cacheable() -> None:
+    q = Select(cacheable=True)
+    sql_t = q.from_table("t1").columns("t1c1").sql()
+    assert sql_t == ("SELECT SQL_CACHE `t1c1` FROM t1", None)
+
+
+def test_sql_params_copied_per_call(t1: Select) -> None:
+    q = t1.where_value("t1c1", "a")
+    sql_t = q.sql()
+    assert sql_t == ("SELECT * FROM t1 WHERE `t1c1` = ?", ["a"])
+    assert isinstance(sql_t, tuple)
+    assert isinstance(sql_t[1], list)
+    sql_t[1].append("evil")
+    assert q.sql() == ("SELECT * FROM t1 WHERE `t1c1` = ?", ["a"])
+
+
+def test_not_cacheable() -> None:
+    q = Select(cacheable=False)
+    sql_t = q.from_table("t1").columns("t1c1").sql()
+    assert sql_t == ("SELECT SQL_NO_CACHE `t1c1` FROM t1", None)
+
+
+def test_where_value_utf_noparam() -> None:
+    q = Select(placeholder=False)
+    sql = q.from_table("t1").where_value("t1c1", '"äöü"').sql()
+    assert sql == 'SELECT * FROM t1 WHERE `t1c1` = "äöü"'
+
+
+def test_remove_col(t1: Select) -> None:
+    sql_t = t1.columns(("t1c1", "t2c1")).remove_column("t2c1").sql()
+    assert sql_t == ("SELECT `t1c1` FROM t1", None)
+
+
+def test_remove_col_expr(t1: Select) -> None:
+    sql_t = t1.columns("t1c1").column_expr("1+1 AS t2c1").remove_column("t2c1").sql()
+    assert sql_t == ("SELECT `t1c1` FROM t1", None)
+
+
+def test_qualify_columns(t1: Select) -> None:
+    sql_t = t1.columns(("t1c1", "t1c2")).qualify_columns("t1", ("t1c1",)).sql()
+    assert sql_t == ("SELECT t1.`t1c1`, `t1c2` FROM t1", None)
+
+
+def test_qualify_columns_all(t1: Select) -> None:
+    sql_t = t1.columns(("t1c1", "t1c2")).qualify_columns("t1").sql()
+    assert sql_t == ("SELECT t1.`t1c1`, t1.`t1c2` FROM t1", None)
+
+
+def test_qualify_columns_all_nonqual() -> None:
+    q = Select()
+    sql_t = q.from_table(("t1", "t2")).columns(("t1c1", "t2.t2c1")).qualify_columns("t1").sql()
+    assert sql_t == ("SELECT t1.`t1c1`, t2.`t2c1` FROM t1, t2", None)
+
+
+# (builder, match) rows for statements that cannot be rendered; new
+# negative tests append a row here rather than a new function.
+ERROR_CASES = [
+    (lambda: Select().columns(COLS_12).left_join("t2", "t1c1"), "root table"),
+]
+
+
+@pytest.mark.parametrize(("builder", "match"), ERROR_CASES)
+def test_sql_errors(builder, match) -> None:
+    with pytest.raises(ValueError, match=match):
+        builder().sql()
@@ -2,66 +2,61 @@ import pytest
 
 from mysqlstmt import Select, Union
 
+# (builder, expected) rows; each structurally identical rendering is one row.
+UNION_CASES = [
+    (
+        lambda: Union().union("SELECT `t1c1` FROM t1"),
+        ("(SELECT `t1c1` FROM t1)", None),
+    ),
+    (
+        lambda: Union().union("SELECT `t1c1` FROM t1").select("SELECT `t2c1` FROM t2"),
+        ("(SELECT `t1c1` FROM t1) UNION (SELECT `t2c1` FROM t2)", None),
+    ),
+    (
+        lambda: Union().union("SELECT `t1c1` AS sort_col FROM t1").select("SELECT `t2c1` FROM t2").order_by("sort_col, DESC"),
+        ("(SELECT `t1c1` AS sort_col FROM t1) UNION (SELECT `t2c1` FROM t2) ORDER BY sort_col, DESC", None),
+    ),
+    (
+        lambda: Union().union("SELECT `t1c1` AS sort_col FROM t1").select("SELECT `t2c1` FROM t2").order_by("sort_col, DESC").limit(5),
+        ("(SELECT `t1c1` AS sort_col FROM t1) UNION (SELECT `t2c1` FROM t2) ORDER BY sort_col, DESC LIMIT 5", None),
+    ),
+    (
+        lambda: Union().union("SELECT `t1c1` AS sort_col FROM t1").select("SELECT `t2c1` FROM t2").order_by("sort_col, DESC").limit(10, 5),
+        ("(SELECT `t1c1` AS sort_col FROM t1) UNION (SELECT `t2c1` FROM t2) ORDER BY sort_col, DESC LIMIT 5,10", None),
+    ),
+    (
+        lambda: Union(distinct=False).union("SELECT `t1c1` FROM t1").select("SELECT `t2c1` FROM t2"),
+        ("(SELECT `t1c1` FROM t1) UNION ALL (SELECT `t2c1` FROM t2)", None),
+    ),
+]
 
-class TestUnion:
-    def test_single(self) -> None:
-        q = Union()
-        sql_t = q.union("SELECT `t1c1` FROM t1").sql()
-        assert sql_t == ("(SELECT `t1c1` FROM t1)", None)
 
-    def test_double(self) -> None:
-        q = Union()
-        sql_t = q.union("SELECT `t1c1` FROM t1").select("SELECT `t2c1` FROM t2").sql()
-        assert sql_t == ("(SELECT `t1c1` FROM t1) UNION (SELECT `t2c1` FROM t2)", None)
-
-    def test_orderby(self) -> None:
-        q = Union()
-        sql_t = q.union("SELECT `t1c1` AS sort_col FROM t1").select("SELECT `t2c1` FROM t2").order_by("sort_col, DESC").sql()
-        assert sql_t == ("(SELECT `t1c1` AS sort_col FROM t1) UNION (SELECT `t2c1` FROM t2) ORDER BY sort_col, DESC", None)
-
-    def test_orderby_limit(self) -> None:
-        q = Union()
-        sql_t = q.union("SELECT `t1c1` AS sort_col FROM t1").select("SELECT `t2c1` FROM t2").order_by("sort_col, DESC").limit(5).sql()
-        assert sql_t == ("(SELECT `t1c1` AS sort_col FROM t1) UNION (SELECT `t2c1` FROM t2) ORDER BY sort_col, DESC LIMIT 5", None)
-
-    def test_orderby_limit_offset(self) -> None:
-        q = Union()
-        sql_t = q.union("SELECT `t1c1` AS sort_col FROM t1").select("SELECT `t2c1` FROM t2").order_by("sort_col, DESC").limit(10, 5).sql()
-        assert sql_t == ("(SELECT `t1c1` AS sort_col FROM t1) UNION (SELECT `t2c1` FROM t2) ORDER BY sort_col, DESC LIMIT 5,10", None)
+class TestUnion:
+    @pytest.mark.parametrize(("builder", "expected"), UNION_CASES)
+    def test_union(self, builder, expected) -> None:
+        assert builder().sql() == expected
 
-    def test_single_obj(self) -> None:
-        s = Select("t1").column("t1c1")
+    def test_single_obj(self, t1_select: Select) -> None:
         q = Union()
-        sql_t = q.union(s).sql()
+        sql_t = q.union(t1_select).sql()
         assert sql_t == ("(SELECT `t1c1` FROM t1)", None)
 
-    def test_double_obj(self) -> None:
-        s1 = Select("t1").column("t1c1")
-        s2 = Select("t2").column("t2c1")
+    def test_double_obj(self, t1_select: Select, t2_select: Select) -> None:
         q = Union()
-        sql_t = q.union(s1).union(s2).sql()
+        sql_t = q.union(t1_select).union(t2_select).sql()
         assert sql_t == ("(SELECT `t1c1` FROM t1) UNION (SELECT `t2c1` FROM t2)", None)
 
-    def test_double_obj_list(self) -> None:
-        s1 = Select("t1").column("t1c1")
-        s2 = Select("t2").column("t2c1")
+    def test_double_obj_list(self, t1_select: Select, t2_select: Select) -> None:
         q = Union()
-        sql_t = q.union([s1, s2]).sql()
+        sql_t = q.union([t1_select, t2_select]).sql()
         assert sql_t == ("(SELECT `t1c1` FROM t1) UNION (SELECT `t2c1` FROM t2)", None)
 
-    def test_double_obj_list_constructor(self) -> None:
-        s1 = Select("t1").column("t1c1")
-        s2 = Select("t2").column("t2c1")
-        q = Union([s1, s2])
+    def test_double_obj_list_constructor(self, t1_select: Select, t2_select: Select) -> None:
+        q = Union([t1_select, t2_select])
         sql_t = q.sql()
         assert sql_t == ("(SELECT `t1c1` FROM t1) UNION (SELECT `t2c1` FROM t2)", None)
 
-    def test_union_all(self) -> None:
-        q = Union(distinct=False)
-        sql_t = q.union("SELECT `t1c1` FROM t1").select("SELECT `t2c1` FROM t2").sql()
-        assert sql_t == ("(SELECT `t1c1` FROM t1) UNION ALL (SELECT `t2c1` FROM t2)", None)
-
     def test_fail_no_stmts(self) -> None:
         q = Union()
-        with pytest.raises(ValueError):  # noqa: PT011
+        with pytest.raises(ValueError, match="No SELECT statements"):
             q.sql()
@@ -1,51 +1,76 @@
+import pytest
+
 from mysqlstmt import Select, WhereCondition
 
 
 class TestWhereCondition:
-    def test_empty(self) -> None:
-        c = WhereCondition(Select())
+    def test_empty(self, bare_select: Select) -> None:
+        c = WhereCondition(bare_select)
         params = []
         sql = c.sql(params)
         assert sql is None
 
-    def test_nesting(self) -> None:
-        c1 = WhereCondition(Select())
-        c2 = WhereCondition(Select())
-        c3 = WhereCondition(Select())
-        c1.add_cond(c2)
-        c2.add_cond(c3)
-        assert c1.nesting_level == 0
-        assert c2.nesting_level == 1
-        assert c3.nesting_level == 2
-
-    def test_nesting2(self) -> None:
-        c1 = WhereCondition(Select())
-        c2 = WhereCondition(Select())
-        c3 = WhereCondition(Select())
-        c2.add_cond(c3)
-        c1.add_cond(c2)
+    @pytest.mark.parametrize("parent_first", [True, False])
+    def test_nesting(self, bare_select: Select, parent_first: bool) -> None:
+        c1 = WhereCondition(bare_select)
+        c2 = WhereCondition(bare_select)
+        c3 = WhereCondition(bare_select)
+        if parent_first:
+            c1.add_cond(c2)
+            c2.add_cond(c3)
+        else:
+            c2.add_cond(c3)
+            c1.add_cond(c2)
         assert c1.nesting_level == 0
         assert c2.nesting_level == 1
         assert c3.nesting_level == 2
 
-    def test_where_nesting_empty(self) -> None:
-        c1 = WhereCondition(Select())
-        c2 = WhereCondition(Select())
+    def test_where_nesting_empty(self, bare_select: Select) -> None:
+        c1 = WhereCondition(bare_select)
+        c2 = WhereCondition(bare_select)
         c1.add_cond(c2)
         params = []
         sql = c1.sql(params)
         assert sql is None
 
-    def test_where_cond(self) -> None:
-        c = WhereCondition(Select())
+    def test_where_cond(self, bare_select: Select) -> None:
+        c = WhereCondition(bare_select)
         params = []
         sql = c.where_value("t1c1", 3).sql(params)
         assert sql == "`t1c1` = 3"
 
-    def test_where_conds(self) -> None:
-        c1 = WhereCondition(Select())
-        c2 = WhereCondition(Select())
+    def test_where_conds(self, bare_select: Select) -> None:
+        c1 = WhereCondition(bare_select)
+        c2 = WhereCondition(bare_select)
         c1.add_cond(c2)
         params = []
         sql = c1.where_value("t1c1", 3).sql(params)
         assert sql == "`t1c1` = 3"
+
+    def test_add_cond_reparents(self, bare_select: Select) -> None:
+        other = Select("t2")
+        c = WhereCondition(other).where_value("t1c1", 1)
+        q = Select("t1").where_cond(cond=c)
+        assert q.sql() == ("SELECT * FROM t1 WHERE `t1c1` = 1", None)
+        c.where_value("t1c2", 2)
+        assert q.sql() == ("SELECT * FROM t1 WHERE (`t1c1` = 1 AND `t1c2` = 2)", None)
+
+    def test_dedup_expr(self, bare_select: Select) -> None:
+        c = WhereCondition(bare_select)
+        params = []
+        sql = c.where_expr("`t1c1` = NOW()").where_expr("`t1c1` = NOW()").sql(params)
+        assert sql == "`t1c1` = NOW()"
+
+    def test_dedup_or_value(self, bare_select: Select) -> None:
+        c = WhereCondition(bare_select, where_predicate="OR")
+        params = []
+        sql = c.where_value("t1c1", 3).where_value("t1c1", 3).where_value("t1c1", 5).sql(params)
+        assert sql == "`t1c1` IN (3, 5)"
+
+    def test_reorder(self, bare_select: Select) -> None:
+        c = WhereCondition(bare_select, reorder=True)
+        c.where_value("t1c1", "abc%", "LIKE").where_value("t1c2", 5, ">").where_value("t1c3", 3)
+        params = []
+        sql = c.sql(params)
+        assert sql == "(`t1c3` = 3 AND `t1c2` > 5 AND `t1c1` LIKE ?)"
+        assert params == ["abc%"]